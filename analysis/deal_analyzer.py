@@ -3,58 +3,72 @@ Deal Analyzer - Financial analysis for potential flip properties
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
 import numpy as np
 from config import settings
 from models.property import Property
 
 logger = logging.getLogger(__name__)
 
-def estimate_repairs(property_data: Property) -> float:
-    """
-    Estimate repair costs based on property characteristics.
-    This is a simplified model and should be calibrated with actual project data.
+# Repair condition keywords, matched against a property's opportunity keywords
+HIGH_REPAIR_KEYWORDS = frozenset({'fixer', 'needs work', 'tlc', 'handyman', 'distressed'})
+MODERATE_REPAIR_KEYWORDS = frozenset({'dated', 'original', 'renovate', 'update'})
+
+def _condition_factor(opportunity_keywords: List[str]) -> float:
+    """Repair multiplier for a property's condition, based on its keywords"""
+    if HIGH_REPAIR_KEYWORDS.intersection(opportunity_keywords):
+        return 1.5
+    if MODERATE_REPAIR_KEYWORDS.intersection(opportunity_keywords):
+        return 1.25
+    return 1.0
+
+def _repair_costs(square_feet, bathrooms, age, condition_factor) -> np.ndarray:
     """
-    base_sqft_cost = settings.REPAIR_COSTS['base_sqft_cost']
-    
-    # Age factors
-    if property_data.age is None:
-        age_factor = 1.0
-    elif property_data.age > 50:
-        age_factor = 1.5
-    elif property_data.age > 30:
-        age_factor = 1.3
-    elif property_data.age > 15:
-        age_factor = 1.1
-    else:
-        age_factor = 1.0
+    Repair estimate for one property or, given arrays, a whole batch
     
-    # Condition factor (based on keywords in the description)
-    condition_factor = 1.0
-    high_repair_keywords = ['fixer', 'needs work', 'tlc', 'handyman', 'distressed']
-    moderate_repair_keywords = ['dated', 'original', 'renovate', 'update']
+    This is the single implementation of the repair model, used by both
+    estimate_repairs and analyze_deals.
     
-    for keyword in high_repair_keywords:
-        if keyword in property_data.opportunity_keywords:
-            condition_factor = 1.5
-            break
+    Args:
+        square_feet: Square footage
+        bathrooms: Number of bathrooms (0 if unknown)
+        age: Age in years (NaN if unknown, which matches no age bracket)
+        condition_factor: Multiplier from _condition_factor
+        
+    Returns:
+        Repair cost estimate (same shape as the inputs)
+    """
+    square_feet = np.asarray(square_feet, dtype=float)
+    bathrooms = np.asarray(bathrooms, dtype=float)
+    age = np.asarray(age, dtype=float)
     
-    if condition_factor == 1.0:
-        for keyword in moderate_repair_keywords:
-            if keyword in property_data.opportunity_keywords:
-                condition_factor = 1.25
-                break
+    # Age factors
+    age_factor = np.select([age > 50, age > 30, age > 15], [1.5, 1.3, 1.1], default=1.0)
     
     # Calculate the base repair estimate
-    repair_estimate = property_data.square_feet * base_sqft_cost * age_factor * condition_factor
+    repair_costs = square_feet * settings.REPAIR_COSTS['base_sqft_cost'] * age_factor * condition_factor
     
     # Add bathroom and kitchen renovation costs if property is older
-    if property_data.age and property_data.age > 20:
-        repair_estimate += settings.REPAIR_COSTS['kitchen'] * min(1, int(property_data.square_feet / 1500))
-        repair_estimate += settings.REPAIR_COSTS['bathroom'] * min(property_data.bathrooms, 2)
+    renovations = (
+        settings.REPAIR_COSTS['kitchen'] * np.minimum(1, np.trunc(square_feet / 1500))
+        + settings.REPAIR_COSTS['bathroom'] * np.minimum(bathrooms, 2)
+    )
+    repair_costs = repair_costs + np.where(age > 20, renovations, 0)
     
     # Add a contingency
-    repair_estimate *= 1.1  # 10% contingency
+    return repair_costs * 1.1  # 10% contingency
+
+def estimate_repairs(property_data: Property) -> float:
+    """
+    Estimate repair costs based on property characteristics.
+    This is a simplified model and should be calibrated with actual project data.
+    """
+    repair_estimate = float(_repair_costs(
+        property_data.square_feet,
+        property_data.bathrooms or 0,
+        np.nan if property_data.age is None else property_data.age,
+        _condition_factor(property_data.opportunity_keywords)
+    ))
     
     logger.info(f"Repair estimate for {property_data.address}: ${repair_estimate:,.2f}")
     return repair_estimate
@@ -87,39 +101,63 @@ def calculate_holding_costs(purchase_price: float, months: float) -> float:
     total_monthly = sum(monthly_costs.values())
     return total_monthly * months
 
-def analyze_deal(property_data: Property, arv: float, repair_costs: float, min_roi: float = 20.0) -> Dict[str, Any]:
-    """
-    Analyze a potential flip deal and determine if it meets criteria
-    Returns a dictionary with analysis results
+def _deal_metrics(list_price, arv, repair_costs, min_roi: float) -> Dict[str, Any]:
     """
-    # Store values in property object
-    property_data.estimated_repair_cost = repair_costs
-    property_data.estimated_arv = arv
+    Costs, profit, ROI and criteria checks for one deal or, given arrays, a whole batch
     
+    This is the single implementation of the deal model, used by both
+    analyze_deal and analyze_deals.
+    
+    Args:
+        list_price: Purchase (list) price
+        arv: After repair value
+        repair_costs: Estimated repair costs
+        min_roi: Minimum ROI percentage for a deal to meet criteria
+        
+    Returns:
+        Dictionary of deal metrics (same shape as the inputs)
+    """
     # Calculate closing costs
-    closing_costs = calculate_closing_costs(property_data.list_price, arv)
+    closing_costs = calculate_closing_costs(list_price, arv)['total']
     
     # Calculate holding costs (assuming 4 months for renovation and sale)
-    holding_period = settings.AVERAGE_FLIP_MONTHS
-    holding_costs = calculate_holding_costs(property_data.list_price, holding_period)
+    holding_costs = calculate_holding_costs(list_price, settings.AVERAGE_FLIP_MONTHS)
     
-    # Calculate total project costs
-    total_project_cost = property_data.list_price + repair_costs + closing_costs['total'] + holding_costs
-    
-    # Calculate potential profit
+    # Calculate total project costs and potential profit
+    total_project_cost = list_price + repair_costs + closing_costs + holding_costs
     potential_profit = arv - total_project_cost
-    property_data.estimated_profit = potential_profit
     
     # Calculate ROI
     roi = (potential_profit / total_project_cost) * 100
-    property_data.estimated_roi = roi
-    
-    # Check if deal meets minimum ROI criteria
-    meets_criteria = roi >= min_roi
     
     # Apply the 70% rule check
     max_purchase_price = 0.7 * arv - repair_costs
-    meets_70_percent_rule = property_data.list_price <= max_purchase_price
+    
+    return {
+        'closing_costs': closing_costs,
+        'holding_costs': holding_costs,
+        'total_project_cost': total_project_cost,
+        'potential_profit': potential_profit,
+        'roi': roi,
+        'meets_criteria': roi >= min_roi,
+        'meets_70_percent_rule': list_price <= max_purchase_price,
+        'max_purchase_price': max_purchase_price
+    }
+
+def analyze_deal(property_data: Property, arv: float, repair_costs: float, min_roi: float = 20.0) -> Dict[str, Any]:
+    """
+    Analyze a potential flip deal and determine if it meets criteria
+    Returns a dictionary with analysis results
+    """
+    # Store values in property object
+    property_data.estimated_repair_cost = repair_costs
+    property_data.estimated_arv = arv
+    
+    metrics = _deal_metrics(property_data.list_price, arv, repair_costs, min_roi)
+    potential_profit = metrics['potential_profit']
+    roi = metrics['roi']
+    property_data.estimated_profit = potential_profit
+    property_data.estimated_roi = roi
     
     # Create deal object
     deal = {
@@ -128,14 +166,7 @@ def analyze_deal(property_data: Property, arv: float, repair_costs: float, min_r
         'list_price': property_data.list_price,
         'arv': arv,
         'repair_costs': repair_costs,
-        'closing_costs': closing_costs['total'],
-        'holding_costs': holding_costs,
-        'total_project_cost': total_project_cost,
-        'potential_profit': potential_profit,
-        'roi': roi,
-        'meets_criteria': meets_criteria,
-        'meets_70_percent_rule': meets_70_percent_rule,
-        'max_purchase_price': max_purchase_price,
+        **metrics,
         'property_data': property_data.to_dict()
     }
     
@@ -172,4 +203,68 @@ def calculate_arv(property_data: Property) -> float:
     
     logger.info(f"Calculated ARV for {property_data.address}: ${arv:,.2f}")
     return arv
-    
\ No newline at end of file
+    
+def analyze_deals(properties: List[Property], min_roi: float = 20.0) -> List[Dict[str, Any]]:
+    """
+    Analyze a batch of properties at once and return the deals that meet criteria
+    
+    Uses the same repair and deal model as estimate_repairs and analyze_deal,
+    evaluated as NumPy arrays over the whole batch.
+    ARV is still calculated per property since it depends on each property's comps.
+    Estimated repair cost, ARV, profit and ROI are stored on every property.
+    
+    Args:
+        properties: Properties to analyze
+        min_roi: Minimum ROI percentage for a deal to meet criteria
+        
+    Returns:
+        List of deal dictionaries (as returned by analyze_deal) that meet criteria
+    """
+    if not properties:
+        return []
+    
+    list_price = np.array([prop.list_price for prop in properties], dtype=float)
+    square_feet = np.array([prop.square_feet for prop in properties], dtype=float)
+    bathrooms = np.array([prop.bathrooms or 0 for prop in properties], dtype=float)
+    age = np.array([np.nan if prop.age is None else prop.age for prop in properties], dtype=float)
+    condition_factor = np.array([_condition_factor(prop.opportunity_keywords) for prop in properties])
+    arv = np.array([calculate_arv(prop) for prop in properties], dtype=float)
+    
+    repair_costs = _repair_costs(square_feet, bathrooms, age, condition_factor)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        metrics = _deal_metrics(list_price, arv, repair_costs, min_roi)
+    
+    potential_profit = metrics['potential_profit']
+    roi = metrics['roi']
+    meets_criteria = metrics['meets_criteria']
+    
+    deals = []
+    for i, prop in enumerate(properties):
+        prop.estimated_repair_cost = float(repair_costs[i])
+        prop.estimated_arv = float(arv[i])
+        prop.estimated_profit = float(potential_profit[i])
+        prop.estimated_roi = float(roi[i])
+        
+        # Only build deal records for properties that meet criteria
+        if not meets_criteria[i]:
+            continue
+        
+        deals.append({
+            'property_id': prop.mls_id,
+            'address': prop.get_full_address(),
+            'list_price': prop.list_price,
+            'arv': float(arv[i]),
+            'repair_costs': float(repair_costs[i]),
+            'closing_costs': float(metrics['closing_costs'][i]),
+            'holding_costs': float(metrics['holding_costs'][i]),
+            'total_project_cost': float(metrics['total_project_cost'][i]),
+            'potential_profit': float(potential_profit[i]),
+            'roi': float(roi[i]),
+            'meets_criteria': True,
+            'meets_70_percent_rule': bool(metrics['meets_70_percent_rule'][i]),
+            'max_purchase_price': float(metrics['max_purchase_price'][i]),
+            'property_data': prop.to_dict()
+        })
+    
+    logger.info(f"Analyzed {len(properties)} properties: {len(deals)} meet the {min_roi}% ROI criteria")
+    return deals
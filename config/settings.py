@@ -6,6 +6,12 @@ Configuration Settings for Real Estate Flip Finder
 MAX_DAYS_ON_MARKET = 90
 PROPERTY_TYPES = ['Residential', 'Condo/Co-Op', 'Townhouse']
 
+# Concurrency
+ENRICHMENT_WORKERS = 16  # Threads used to enrich properties with public records and comps
+
+# Simulated data
+RANDOM_SEED = None  # Set to an int to reproduce simulated comps and records (None: fresh entropy each run)
+
 # Opportunity Keywords
 OPPORTUNITY_KEYWORDS = [
     'as-is', 'fixer', 'needs work', 'handyman', 'tlc', 'potential', 'opportunity',
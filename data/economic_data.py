@@ -3,10 +3,10 @@ Economic Data - Get economic indicators and forecasts
 """
 
 import logging
-import random
 import requests
 from typing import Dict, Any, Optional
-from datetime import datetime
+from datetime import date
+from utils.rng import get_rng
 from config import credentials
 
 logger = logging.getLogger(__name__)
@@ -29,33 +29,35 @@ def get_economic_indicators(zip_code: Optional[str] = None) -> Dict[str, Any]:
         Dictionary with economic indicators
     """
     try:
+        rng = get_rng()
+        
         # This is a placeholder - in a real implementation, you'd query
         # actual economic data from APIs
         
         # Generate current date for reference
-        current_date = datetime.now().strftime('%Y-%m-%d')
+        current_date = date.today().isoformat()
         
         # Create simulated economic indicators
         indicators = {
             'data_date': current_date,
-            'unemployment_rate': round(random.uniform(3.0, 6.0), 1),
-            'median_income': random.randint(40000, 120000),
-            'population_growth': round(random.uniform(-0.5, 2.5), 1),
-            'job_growth': round(random.uniform(-1.0, 3.0), 1),
-            'mortgage_rate_30yr': round(random.uniform(2.5, 4.5), 2),
-            'housing_inventory': round(random.uniform(2.0, 7.0), 1),  # Months of inventory
-            'median_days_on_market': random.randint(20, 60)
+            'unemployment_rate': round(float(rng.uniform(3.0, 6.0)), 1),
+            'median_income': int(rng.integers(40000, 120001)),
+            'population_growth': round(float(rng.uniform(-0.5, 2.5)), 1),
+            'job_growth': round(float(rng.uniform(-1.0, 3.0)), 1),
+            'mortgage_rate_30yr': round(float(rng.uniform(2.5, 4.5)), 2),
+            'housing_inventory': round(float(rng.uniform(2.0, 7.0)), 1),  # Months of inventory
+            'median_days_on_market': int(rng.integers(20, 61))
         }
         
         # Add regional data if zip code is provided
         if zip_code:
             indicators['region'] = {
                 'zip_code': zip_code,
-                'median_home_price': random.randint(150000, 750000),
-                'price_growth_1yr': round(random.uniform(-5.0, 15.0), 1),
-                'foreclosure_rate': round(random.uniform(0.1, 2.0), 2),
-                'rental_vacancy_rate': round(random.uniform(2.0, 8.0), 1),
-                'price_to_rent_ratio': round(random.uniform(10, 30), 1)
+                'median_home_price': int(rng.integers(150000, 750001)),
+                'price_growth_1yr': round(float(rng.uniform(-5.0, 15.0)), 1),
+                'foreclosure_rate': round(float(rng.uniform(0.1, 2.0)), 2),
+                'rental_vacancy_rate': round(float(rng.uniform(2.0, 8.0)), 1),
+                'price_to_rent_ratio': round(float(rng.uniform(10, 30)), 1)
             }
         
         logger.info(f"Generated economic indicators" + (f" for ZIP {zip_code}" if zip_code else ""))
@@ -79,6 +81,8 @@ def get_census_data(zip_code: str) -> Dict[str, Any]:
         Dictionary with census data
     """
     try:
+        rng = get_rng()
+        
         # In a real implementation, you'd use the Census API
         # Example:
         # url = f"https://api.census.gov/data/2019/acs/acs5?get=NAME,B01003_001E,B19013_001E,B25077_001E&for=zip%20code%20tabulation%20area:{zip_code}&key={credentials.CENSUS_API_KEY}"
@@ -88,32 +92,32 @@ def get_census_data(zip_code: str) -> Dict[str, Any]:
         # For now, generate mock data
         census_data = {
             'zip_code': zip_code,
-            'population': random.randint(10000, 50000),
-            'households': random.randint(3000, 20000),
-            'median_age': round(random.uniform(30, 45), 1),
+            'population': int(rng.integers(10000, 50001)),
+            'households': int(rng.integers(3000, 20001)),
+            'median_age': round(float(rng.uniform(30, 45)), 1),
             'demographics': {
-                'white': round(random.uniform(0.4, 0.8), 2),
-                'black': round(random.uniform(0.05, 0.4), 2),
-                'hispanic': round(random.uniform(0.05, 0.4), 2),
-                'asian': round(random.uniform(0.02, 0.2), 2),
-                'other': round(random.uniform(0.01, 0.1), 2)
+                'white': round(float(rng.uniform(0.4, 0.8)), 2),
+                'black': round(float(rng.uniform(0.05, 0.4)), 2),
+                'hispanic': round(float(rng.uniform(0.05, 0.4)), 2),
+                'asian': round(float(rng.uniform(0.02, 0.2)), 2),
+                'other': round(float(rng.uniform(0.01, 0.1)), 2)
             },
             'education': {
-                'high_school': round(random.uniform(0.8, 0.99), 2),
-                'bachelors': round(random.uniform(0.2, 0.6), 2),
-                'graduate': round(random.uniform(0.1, 0.3), 2)
+                'high_school': round(float(rng.uniform(0.8, 0.99)), 2),
+                'bachelors': round(float(rng.uniform(0.2, 0.6)), 2),
+                'graduate': round(float(rng.uniform(0.1, 0.3)), 2)
             },
             'housing': {
-                'owner_occupied': round(random.uniform(0.5, 0.8), 2),
-                'renter_occupied': round(random.uniform(0.2, 0.5), 2),
-                'vacant': round(random.uniform(0.02, 0.1), 2),
-                'median_home_value': random.randint(150000, 750000),
-                'median_rent': random.randint(800, 2500)
+                'owner_occupied': round(float(rng.uniform(0.5, 0.8)), 2),
+                'renter_occupied': round(float(rng.uniform(0.2, 0.5)), 2),
+                'vacant': round(float(rng.uniform(0.02, 0.1)), 2),
+                'median_home_value': int(rng.integers(150000, 750001)),
+                'median_rent': int(rng.integers(800, 2501))
             },
             'income': {
-                'median_household': random.randint(40000, 120000),
-                'per_capita': random.randint(25000, 70000),
-                'below_poverty': round(random.uniform(0.05, 0.2), 2)
+                'median_household': int(rng.integers(40000, 120001)),
+                'per_capita': int(rng.integers(25000, 70001)),
+                'below_poverty': round(float(rng.uniform(0.05, 0.2)), 2)
             }
         }
         
@@ -139,37 +143,39 @@ def get_housing_market_trends(area: Optional[str] = None) -> Dict[str, Any]:
         Dictionary with housing market trends
     """
     try:
+        rng = get_rng()
+        
         # This is a placeholder - in a real implementation, you'd query
         # actual housing market data
         
         trends = {
-            'data_date': datetime.now().strftime('%Y-%m-%d'),
-            'inventory_trend': round(random.uniform(-20, 20), 1),  # % change YoY
-            'days_on_market_trend': round(random.uniform(-30, 30), 1),  # % change YoY
-            'list_to_sold_ratio': round(random.uniform(0.93, 1.05), 2),  # List price to sold price ratio
-            'price_reductions': round(random.uniform(10, 40), 1),  # % of listings with price reductions
+            'data_date': date.today().isoformat(),
+            'inventory_trend': round(float(rng.uniform(-20, 20)), 1),  # % change YoY
+            'days_on_market_trend': round(float(rng.uniform(-30, 30)), 1),  # % change YoY
+            'list_to_sold_ratio': round(float(rng.uniform(0.93, 1.05)), 2),  # List price to sold price ratio
+            'price_reductions': round(float(rng.uniform(10, 40)), 1),  # % of listings with price reductions
             'price_trend': {
-                '1month': round(random.uniform(-2, 2), 1),  # % change
-                '3month': round(random.uniform(-5, 5), 1),  # % change
-                '1year': round(random.uniform(-10, 15), 1),  # % change
-                '5year': round(random.uniform(5, 50), 1)  # % change
+                '1month': round(float(rng.uniform(-2, 2)), 1),  # % change
+                '3month': round(float(rng.uniform(-5, 5)), 1),  # % change
+                '1year': round(float(rng.uniform(-10, 15)), 1),  # % change
+                '5year': round(float(rng.uniform(5, 50)), 1)  # % change
             },
             'forecast': {
-                '3month': round(random.uniform(-3, 3), 1),  # % change predicted
-                '6month': round(random.uniform(-5, 5), 1),  # % change predicted
-                '1year': round(random.uniform(-7, 7), 1)  # % change predicted
+                '3month': round(float(rng.uniform(-3, 3)), 1),  # % change predicted
+                '6month': round(float(rng.uniform(-5, 5)), 1),  # % change predicted
+                '1year': round(float(rng.uniform(-7, 7)), 1)  # % change predicted
             },
-            'market_type': random.choice(['Buyer\'s Market', 'Balanced Market', 'Seller\'s Market'])
+            'market_type': str(rng.choice(['Buyer\'s Market', 'Balanced Market', 'Seller\'s Market']))
         }
         
         # Add regional specifics if area provided
         if area:
             trends['area'] = area
             trends['regional_factors'] = {
-                'population_trend': round(random.uniform(-2, 5), 1),  # % change
-                'job_growth': round(random.uniform(-3, 5), 1),  # % change
-                'new_construction_permits': random.randint(50, 1000),
-                'affordability_index': round(random.uniform(70, 150), 1)  # >100 means more affordable
+                'population_trend': round(float(rng.uniform(-2, 5)), 1),  # % change
+                'job_growth': round(float(rng.uniform(-3, 5)), 1),  # % change
+                'new_construction_permits': int(rng.integers(50, 1001)),
+                'affordability_index': round(float(rng.uniform(70, 150)), 1)  # >100 means more affordable
             }
         
         logger.info(f"Generated housing market trends" + (f" for {area}" if area else ""))
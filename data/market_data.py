@@ -3,14 +3,15 @@ Market Data - Get comparable sales and market trends
 """
 
 import logging
-import random
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from datetime import date, timedelta
+from typing import List, Dict, Any, Optional
+from numpy.random import Generator
+from utils.rng import get_rng
 from models.property import Property
 
 logger = logging.getLogger(__name__)
 
-def add_comps(property_data: Property, num_comps=5):
+def add_comps(property_data: Property, num_comps=5, rng: Optional[Generator] = None):
     """
     Add comparable property sales (comps) to the property data
     
@@ -20,31 +21,40 @@ def add_comps(property_data: Property, num_comps=5):
     3. Analyze and normalize the data
     
     Since this requires API access that might not be available, we're
-    creating simulated comps for demonstration purposes.
+    creating simulated comps for demonstration purposes. Pass rng (see
+    utils.rng.spawn_rngs) to make a task's comps independent of the thread
+    that runs it; otherwise the calling thread's generator is used.
     """
     try:
+        if rng is None:
+            rng = get_rng()
+        
         # This is a placeholder - in a real implementation, you'd query
         # actual comparable sales from MLS or other real estate data sources
         
         comps = []
         base_price_per_sqft = property_data.list_price / property_data.square_feet if property_data.square_feet else 100
         
+        # Draw all random variations for the comps in one batch
+        price_per_sqft_variations = rng.uniform(0.85, 1.15, num_comps)  # ±15% price per sqft
+        sqft_variations = rng.uniform(0.85, 1.15, num_comps)  # ±15% square footage
+        days_ago = rng.integers(7, 181, num_comps)  # Sale date in the past 6 months
+        bedroom_offsets = rng.integers(-1, 2, num_comps)
+        bathroom_offsets = rng.choice([-0.5, 0, 0.5], num_comps)
+        year_offsets = rng.integers(-5, 6, num_comps)
+        distances = rng.uniform(0.1, 1.0, num_comps)  # Distance in miles
+        
+        today = date.today()
+        
         # Generate several comparable properties
         for i in range(num_comps):
-            # Vary the price per square foot by ±15%
-            price_per_sqft_variation = random.uniform(0.85, 1.15)
-            adjusted_price_per_sqft = base_price_per_sqft * price_per_sqft_variation
-            
-            # Vary the square footage by ±15%
-            sqft_variation = random.uniform(0.85, 1.15)
-            comp_sqft = property_data.square_feet * sqft_variation
+            adjusted_price_per_sqft = base_price_per_sqft * float(price_per_sqft_variations[i])
+            comp_sqft = property_data.square_feet * float(sqft_variations[i])
             
             # Calculate the total price
             comp_price = comp_sqft * adjusted_price_per_sqft
             
-            # Generate a random sale date in the past 6 months
-            days_ago = random.randint(7, 180)
-            sale_date = (datetime.now() - timedelta(days=days_ago)).strftime('%Y-%m-%d')
+            sale_date = (today - timedelta(days=int(days_ago[i]))).isoformat()
             
             # Create the comp record
             comp = {
@@ -53,10 +63,10 @@ def add_comps(property_data: Property, num_comps=5):
                 'price': comp_price,
                 'square_feet': comp_sqft,
                 'price_per_sqft': adjusted_price_per_sqft,
-                'bedrooms': max(1, property_data.bedrooms + random.randint(-1, 1)),
-                'bathrooms': max(1, property_data.bathrooms + random.choice([-0.5, 0, 0.5])),
-                'year_built': property_data.year_built + random.randint(-5, 5) if property_data.year_built else 2000,
-                'distance': random.uniform(0.1, 1.0)  # Distance in miles
+                'bedrooms': max(1, property_data.bedrooms + int(bedroom_offsets[i])),
+                'bathrooms': max(1, property_data.bathrooms + float(bathroom_offsets[i])),
+                'year_built': property_data.year_built + int(year_offsets[i]) if property_data.year_built else 2000,
+                'distance': float(distances[i])
             }
             
             comps.append(comp)
@@ -84,16 +94,18 @@ def get_neighborhood_data(property_data: Property) -> Dict[str, Any]:
     2. Analyze trends in the neighborhood
     """
     try:
+        rng = get_rng()
+        
         # This is a placeholder - in a real implementation, you'd query
         # actual neighborhood data
         
         neighborhood_data = {
-            'school_rating': random.randint(1, 10),
-            'crime_index': random.randint(1, 100),
-            'walk_score': random.randint(1, 100),
-            'median_income': random.randint(40000, 120000),
-            'population_growth': random.uniform(-0.02, 0.05),
-            'price_trend': random.uniform(-0.05, 0.1)
+            'school_rating': int(rng.integers(1, 11)),
+            'crime_index': int(rng.integers(1, 101)),
+            'walk_score': int(rng.integers(1, 101)),
+            'median_income': int(rng.integers(40000, 120001)),
+            'population_growth': float(rng.uniform(-0.02, 0.05)),
+            'price_trend': float(rng.uniform(-0.05, 0.1))
         }
         
         # Add the data to the property
@@ -115,17 +127,19 @@ def analyze_market_trends(zip_code: str = None) -> Dict[str, Any]:
     2. Calculate trends and market indicators
     """
     try:
+        rng = get_rng()
+        
         # This is a placeholder - in a real implementation, you'd query
         # actual market trend data
         
         market_data = {
-            'average_dom': random.randint(10, 60),
-            'inventory_months': round(random.uniform(1.0, 8.0), 1),
-            'year_over_year_appreciation': round(random.uniform(-5.0, 15.0), 1),
-            'median_price': random.randint(200000, 500000),
-            'price_per_sqft_trend': round(random.uniform(-5.0, 10.0), 1),
-            'seller_buyer_index': round(random.uniform(0.5, 1.5), 2),  # >1 is seller's market
-            'foreclosure_rate': round(random.uniform(0.1, 3.0), 2)
+            'average_dom': int(rng.integers(10, 61)),
+            'inventory_months': round(float(rng.uniform(1.0, 8.0)), 1),
+            'year_over_year_appreciation': round(float(rng.uniform(-5.0, 15.0)), 1),
+            'median_price': int(rng.integers(200000, 500001)),
+            'price_per_sqft_trend': round(float(rng.uniform(-5.0, 10.0)), 1),
+            'seller_buyer_index': round(float(rng.uniform(0.5, 1.5)), 2),  # >1 is seller's market
+            'foreclosure_rate': round(float(rng.uniform(0.1, 3.0)), 2)
         }
         
         if zip_code:
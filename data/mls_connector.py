@@ -80,29 +80,37 @@ class BrightMLSConnector:
         return query
     
     def search_properties(self, area, max_price, days_on_market, property_types):
-        """Search for properties matching criteria"""
+        """
+        Search for properties matching criteria
+        
+        Yields raw MLS property records page by page, following the
+        ``@odata.nextLink`` continuation so only one page is held in memory.
+        """
         if not self.authenticate():
-            return []
+            return
         
         query = self.build_search_query(area, max_price, days_on_market, property_types)
         
         try:
             search_url = f"{self.api_url}/properties/search"
             response = requests.post(search_url, headers=self.headers, json=query)
-            response.raise_for_status()
             
-            results = response.json()
-            logger.info(f"Found {len(results['value'])} properties in MLS search")
-            
-            return results['value']
+            while True:
+                response.raise_for_status()
+                results = response.json()
+                logger.info(f"Found {len(results['value'])} properties in MLS search page")
+                
+                yield from results['value']
+                
+                next_link = results.get('@odata.nextLink')
+                if not next_link:
+                    break
+                response = requests.get(next_link, headers=self.headers)
         except requests.exceptions.RequestException as e:
             logger.error(f"Property search error: {str(e)}")
-            return []
     
     def convert_to_property_objects(self, mls_properties):
-        """Convert MLS data to Property objects"""
-        properties = []
-        
+        """Convert MLS data to Property objects, yielding one at a time"""
         for prop_data in mls_properties:
             try:
                 # Create property object
@@ -128,12 +136,10 @@ class BrightMLSConnector:
                 # Extract keywords that might indicate potential for flipping
                 property_obj.opportunity_keywords = self.extract_opportunity_keywords(prop_data)
                 
-                properties.append(property_obj)
+                yield property_obj
             except Exception as e:
                 logger.error(f"Error converting property data: {str(e)}")
                 continue
-        
-        return properties
     
     def extract_opportunity_keywords(self, prop_data):
         """Extract keywords that might indicate a good flip opportunity"""
@@ -154,4 +160,5 @@ def get_properties(area=None, max_price=None, days_on_market=90, property_types=
     connector = BrightMLSConnector()
     mls_properties = connector.search_properties(area, max_price, days_on_market, property_types)
     
-    return connector.convert_to_property_objects(mls_properties)
+    # Pages are converted as they stream in; only the final Property list is materialized
+    return list(connector.convert_to_property_objects(mls_properties))
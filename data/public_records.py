@@ -5,7 +5,7 @@ Public Records - Get data from county tax records
 import logging
 import requests
 from typing import Dict, Any, Optional
-import random  # For mock data
+from utils.rng import get_rng
 from config import credentials
 from models.property import Property
 
@@ -70,11 +70,13 @@ def get_property_history(address: str, city: str, state: str, zip_code: str) ->
         Dictionary with property history
     """
     try:
+        rng = get_rng()
+        
         # This is a placeholder - in a real implementation, you'd
         # query actual property history records
         
         # Generate mock property history
-        num_sales = random.randint(1, 5)
+        num_sales = int(rng.integers(1, 6))
         history = {
             'sales': [],
             'permits': [],
@@ -83,19 +85,19 @@ def get_property_history(address: str, city: str, state: str, zip_code: str) ->
         
         # Generate mock sales history
         current_year = 2023
-        current_price = random.randint(250000, 750000)
+        current_price = int(rng.integers(250000, 750001))
         
         for i in range(num_sales):
-            year_diff = random.randint(2, 7)
+            year_diff = int(rng.integers(2, 8))
             current_year -= year_diff
             previous_price = current_price * (0.85 - (i * 0.05))  # Each older sale is cheaper
             
             sale = {
-                'date': f"{current_year}-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}",
+                'date': f"{current_year}-{int(rng.integers(1, 13)):02d}-{int(rng.integers(1, 29)):02d}",
                 'price': previous_price,
                 'buyer': f"Owner {num_sales - i}",
                 'seller': f"Owner {num_sales - i - 1}" if i < num_sales - 1 else "Original Owner",
-                'type': random.choice(['Regular Sale', 'Regular Sale', 'Regular Sale', 'Foreclosure', 'Short Sale'])
+                'type': str(rng.choice(['Regular Sale', 'Regular Sale', 'Regular Sale', 'Foreclosure', 'Short Sale']))
             }
             
             history['sales'].append(sale)
@@ -108,21 +110,21 @@ def get_property_history(address: str, city: str, state: str, zip_code: str) ->
                 
                 history['foreclosures'].append({
                     'date': '-'.join(foreclosure_date),
-                    'lender': random.choice(['Bank of America', 'Wells Fargo', 'Chase', 'Local Credit Union']),
+                    'lender': str(rng.choice(['Bank of America', 'Wells Fargo', 'Chase', 'Local Credit Union'])),
                     'amount': sale['price'] * 1.1
                 })
         
         # Generate mock permit history
-        num_permits = random.randint(0, 5)
+        num_permits = int(rng.integers(0, 6))
         for i in range(num_permits):
-            permit_year = random.randint(current_year, 2023)
+            permit_year = int(rng.integers(current_year, 2024))
             
             permit = {
-                'date': f"{permit_year}-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}",
-                'type': random.choice(['Renovation', 'Addition', 'Roof', 'Electrical', 'Plumbing', 'HVAC']),
-                'description': f"{random.choice(['Minor', 'Major', 'Standard'])} {random.choice(['Renovation', 'Repair', 'Upgrade', 'Installation'])}",
-                'value': random.randint(1000, 50000),
-                'status': random.choice(['Completed', 'Completed', 'Completed', 'In Progress', 'Expired'])
+                'date': f"{permit_year}-{int(rng.integers(1, 13)):02d}-{int(rng.integers(1, 29)):02d}",
+                'type': str(rng.choice(['Renovation', 'Addition', 'Roof', 'Electrical', 'Plumbing', 'HVAC'])),
+                'description': f"{str(rng.choice(['Minor', 'Major', 'Standard']))} {str(rng.choice(['Renovation', 'Repair', 'Upgrade', 'Installation']))}",
+                'value': int(rng.integers(1000, 50001)),
+                'status': str(rng.choice(['Completed', 'Completed', 'Completed', 'In Progress', 'Expired']))
             }
             
             history['permits'].append(permit)
@@ -152,12 +154,14 @@ def get_tax_assessment(address: str, city: str, state: str, zip_code: str) -> Di
         Dictionary with tax assessment data
     """
     try:
+        rng = get_rng()
+        
         # This is a placeholder - in a real implementation, you'd
         # query actual tax assessment records
         
         # Generate mock tax assessment data
         current_year = 2023
-        property_value = random.randint(250000, 750000)
+        property_value = int(rng.integers(250000, 750001))
         
         assessment = {
             'current': {
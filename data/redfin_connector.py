@@ -3,14 +3,22 @@ Redfin Connector - Unofficial API access to Redfin property data
 """
 
 import logging
-import requests
-import requests_html
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession, DO_NOT_CACHE
+from urllib3.util.retry import Retry
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
 import re
-import json
-import csv
+import orjson
 import io
+import os
+import pickle
 import time
+import uuid
+import functools
+import threading
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 import urllib.parse
@@ -18,6 +26,229 @@ from models.property import Property
 
 logger = logging.getLogger(__name__)
 
+BASE_URL = "https://www.redfin.com"
+SEARCH_URL = "https://www.redfin.com/stingray/api/gis-csv?al=3&fixer=true&has_att_fiber=false&has_deal=false&has_dishwasher=false&has_laundry_facility=false&has_laundry_hookups=false&has_parking=false&has_pool=false&has_short_term_lease=false&include_pending_homes=false&isRentals=false&is_furnished=false&is_income_restricted=false&is_senior_living=false&market=dc&num_homes=350&ord=redfin-recommended-asc&page_number=1&poly=-77.119901%2038.791514%2C-76.9095394%2038.791514%2C-76.9095394%2038.9953797%2C-77.119901%2038.9953797%2C-77.119901%2038.791514&pool=false&region_id=12839&region_type=6&sf=1,2,3,5,6,7&status=9&travel_with_traffic=false&travel_within_region=false&uipt=1,3&utilities_included=false&v=8"#f"{BASE_URL}/stingray/do/location-autocomplete"
+FILTER_URL = "https://www.redfin.com/stingray/api/gis-csv?al=3&fixer=true&has_att_fiber=false&has_deal=false&has_dishwasher=false&has_laundry_facility=false&has_laundry_hookups=false&has_parking=false&has_pool=false&has_short_term_lease=false&include_pending_homes=false&isRentals=false&is_furnished=false&is_income_restricted=false&is_senior_living=false&market=dc&num_homes=350&ord=redfin-recommended-asc&page_number=1&poly=-77.119901%2038.791514%2C-76.9095394%2038.791514%2C-76.9095394%2038.9953797%2C-77.119901%2038.9953797%2C-77.119901%2038.791514&pool=false&region_id=12839&region_type=6&sf=1,2,3,5,6,7&status=9&travel_with_traffic=false&travel_within_region=false&uipt=1,3&utilities_included=false&v=8"#f"{BASE_URL}/api/v1/search/filterParamsFromQuery"
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "TE": "Trailers",
+}
+
+# Headers for the GIS CSV request (a Referer for the location is added per call)
+CSV_REQUEST_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Connection": "keep-alive",
+    "Host": "www.redfin.com",
+    "Upgrade-Insecure-Requests": "1",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# Our property types mapped to Redfin's uipt codes
+REDFIN_PROPERTY_TYPES = {
+    "Residential": "1",
+    "Condo/Co-Op": "2",
+    "Townhouse": "3",
+    "Multi-Family": "4",
+    "Land": "5",
+    "Other": "6"
+}
+
+# Stingray JSON responses are prefixed with this guard
+_STINGRAY_PREFIX = b"{}&&"
+
+# Region ID embedded in a location URL, and the CSV download link in a GIS response
+_REGION_RE = re.compile(r"/(\d+)_nb/")
+_URL_RE = re.compile(r'"url":"([^"]+)"')
+
+# Redfin CSV columns used to build Property objects, in unpacking order
+REDFIN_COLUMNS = [
+    'MLS#', 'LISTING ID', 'ADDRESS', 'CITY', 'STATE OR PROVINCE', 'ZIP OR POSTAL CODE',
+    'PRICE', 'BEDS', 'BATHS', 'SQUARE FEET', 'LOT SIZE', 'YEAR BUILT', 'DAYS ON MARKET',
+    'REMARKS', 'PUBLIC REMARKS', 'LATITUDE', 'LONGITUDE', 'PHOTO'
+]
+
+# Column types for parsing Redfin CSV exports
+REDFIN_DTYPES = {
+    'MLS#': str,
+    'LISTING ID': str,
+    'ZIP OR POSTAL CODE': str,
+    'PRICE': 'float32',
+    'BEDS': 'float32',
+    'BATHS': 'float32',
+    'SQUARE FEET': 'float32',
+    'YEAR BUILT': 'Int32',
+    'DAYS ON MARKET': 'Int32'
+}
+
+# Numeric Redfin columns and the type each is coerced to
+REDFIN_NUMERIC_COLUMNS = {
+    'PRICE': float,
+    'BEDS': int,
+    'BATHS': float,
+    'SQUARE FEET': float,
+    'YEAR BUILT': int,
+    'DAYS ON MARKET': int,
+    'LATITUDE': float,
+    'LONGITUDE': float
+}
+
+# Listing remarks terms that suggest a flip opportunity
+OPPORTUNITY_TERMS = [
+    'as-is', 'fixer', 'needs work', 'handyman', 'tlc', 'potential', 'opportunity',
+    'estate sale', 'foreclosure', 'bank owned', 'reo', 'short sale', 'distressed',
+    'investor', 'renovation', 'remodel', 'restore', 'flip', 'under market', 'bargain',
+    'motivated', 'must sell', 'bring offer', 'priced to sell', 'reduced'
+]
+
+# Single alternation over all terms (longest first) so remarks are scanned once.
+# Only the start of a term is anchored, so inflected forms ("investors",
+# "remodeled") still match, as with the MLS connector's substring check
+_OPPORTUNITY_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, sorted(OPPORTUNITY_TERMS, key=len, reverse=True))) + r')',
+    re.IGNORECASE
+)
+
+# Entries kept in each of the connector's in-memory lookup caches
+LOOKUP_CACHE_SIZE = 256
+
+# On-disk HTTP cache for Redfin responses
+REDFIN_HTTP_CACHE = "data/raw/redfin_http_cache"
+
+# Running history of every Redfin listing fetched, stored as a Parquet
+# dataset partitioned by fetch date
+REDFIN_HISTORY_DIR = "data/raw/redfin_properties"
+
+# Column types for the listing history. pandas infers different dtypes from
+# each day's fetch (int8 one day, float64 on a day with blanks), so every file
+# is written with this schema and the dataset is read back with it. Counts are
+# float64 so missing values stay NaN.
+REDFIN_HISTORY_SCHEMA = pa.schema([
+    ('SALE_TYPE', pa.string()),
+    ('SOLD_DATE', pa.string()),
+    ('PROPERTY_TYPE', pa.string()),
+    ('ADDRESS', pa.string()),
+    ('CITY', pa.string()),
+    ('STATE_OR_PROVINCE', pa.string()),
+    ('ZIP_OR_POSTAL_CODE', pa.string()),
+    ('PRICE', pa.float64()),
+    ('BEDS', pa.float64()),
+    ('BATHS', pa.float64()),
+    ('LOCATION', pa.string()),
+    ('SQUARE_FEET', pa.float64()),
+    ('LOT_SIZE', pa.float64()),
+    ('YEAR_BUILT', pa.float64()),
+    ('DAYS_ON_MARKET', pa.float64()),
+    ('$/SQUARE_FEET', pa.float64()),
+    ('HOA/MONTH', pa.float64()),
+    ('STATUS', pa.string()),
+    ('URL', pa.string()),
+    ('SOURCE', pa.string()),
+    ('MLS#', pa.string()),
+    ('LATITUDE', pa.float64()),
+    ('LONGITUDE', pa.float64()),
+    ('AS_OF_DATE', pa.string())
+])
+
+# Listing keys (MLS# or address, plus AS_OF_DATE) already written to the history,
+# by AS_OF_DATE; only the dates most recently written are kept
+REDFIN_SEEN_IDS = "data/raw/redfin_seen_ids.pkl"
+
+def _to_number(values: pd.Series, downcast: Optional[str] = None) -> pd.Series:
+    """Coerce a Redfin column to numbers, stripping "$450,000"-style formatting from text"""
+    if values.dtype == object:
+        values = values.astype(str).str.replace(r'[$,]', '', regex=True)
+    return pd.to_numeric(values, errors='coerce', downcast=downcast)
+
+def _downcast_redfin_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink a freshly parsed Redfin CSV: downcast numeric columns, categorize repetitive text"""
+    # Coordinates stay float64: float32 would turn 38.9 into 38.900001525878906
+    for col in ['LATITUDE', 'LONGITUDE']:
+        if col in df.columns:
+            df[col] = _to_number(df[col])
+    for col in ['PRICE', 'BATHS', 'SQUARE FEET']:
+        if col in df.columns:
+            df[col] = _to_number(df[col], 'float')
+    for col in ['BEDS', 'YEAR BUILT', 'DAYS ON MARKET']:
+        if col in df.columns:
+            df[col] = _to_number(df[col], 'integer')
+    for col in ['CITY', 'STATE OR PROVINCE', 'ZIP OR POSTAL CODE']:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    
+    logger.debug(f"Redfin frame uses {df.memory_usage(deep=True).sum():,} bytes")
+    return df
+
+def _history_table(df: pd.DataFrame) -> pa.Table:
+    """Conform listings (normalized column names) to REDFIN_HISTORY_SCHEMA"""
+    # The export's URL header carries a long note about pricing after "URL"
+    df = df.rename(columns=lambda col: 'URL' if str(col).startswith('URL') else col)
+    
+    columns = {}
+    for field in REDFIN_HISTORY_SCHEMA:
+        if field.name not in df.columns:
+            columns[field.name] = pd.Series(None, index=df.index, dtype='string')
+        elif pa.types.is_floating(field.type):
+            columns[field.name] = _to_number(df[field.name]).astype('float64')
+        else:
+            columns[field.name] = df[field.name].astype('string')
+    
+    return pa.Table.from_pandas(pd.DataFrame(columns), schema=REDFIN_HISTORY_SCHEMA, preserve_index=False)
+
+class _LRUCache:
+    """Thread-safe mapping that keeps only the most recently used entries"""
+    
+    def __init__(self, maxsize: int = LOOKUP_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+    
+    def __setitem__(self, key, value) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+class _ResponseStream(io.RawIOBase):
+    """
+    Read-only file object over a streamed response's decoded body
+    
+    Uses iter_content so gzip/brotli decoding is handled by requests.
+    """
+    
+    def __init__(self, response, chunk_size: int = 64 * 1024):
+        self._chunks = response.iter_content(chunk_size=chunk_size)
+        self._buffer = b""
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            self._buffer = next(self._chunks, None)
+            if self._buffer is None:
+                self._buffer = b""
+                return 0
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
 class RedfinConnector:
     """
     Connector for Redfin's unofficial API
@@ -27,22 +258,29 @@ class RedfinConnector:
     """
     
     def __init__(self):
-        self.base_url = "https://www.redfin.com"
-        self.search_url = "https://www.redfin.com/stingray/api/gis-csv?al=3&fixer=true&has_att_fiber=false&has_deal=false&has_dishwasher=false&has_laundry_facility=false&has_laundry_hookups=false&has_parking=false&has_pool=false&has_short_term_lease=false&include_pending_homes=false&isRentals=false&is_furnished=false&is_income_restricted=false&is_senior_living=false&market=dc&num_homes=350&ord=redfin-recommended-asc&page_number=1&poly=-77.119901%2038.791514%2C-76.9095394%2038.791514%2C-76.9095394%2038.9953797%2C-77.119901%2038.9953797%2C-77.119901%2038.791514&pool=false&region_id=12839&region_type=6&sf=1,2,3,5,6,7&status=9&travel_with_traffic=false&travel_within_region=false&uipt=1,3&utilities_included=false&v=8"#f"{self.base_url}/stingray/do/location-autocomplete"
-        self.initial_info_url = f"{self.base_url}/stingray/api/gis"
-        self.gis_url = f"{self.base_url}/stingray/api/gis"
-        self.filter_url = f"https://www.redfin.com/stingray/api/gis-csv?al=3&fixer=true&has_att_fiber=false&has_deal=false&has_dishwasher=false&has_laundry_facility=false&has_laundry_hookups=false&has_parking=false&has_pool=false&has_short_term_lease=false&include_pending_homes=false&isRentals=false&is_furnished=false&is_income_restricted=false&is_senior_living=false&market=dc&num_homes=350&ord=redfin-recommended-asc&page_number=1&poly=-77.119901%2038.791514%2C-76.9095394%2038.791514%2C-76.9095394%2038.9953797%2C-77.119901%2038.9953797%2C-77.119901%2038.791514&pool=false&region_id=12839&region_type=6&sf=1,2,3,5,6,7&status=9&travel_with_traffic=false&travel_within_region=false&uipt=1,3&utilities_included=false&v=8"#f"{self.base_url}/api/v1/search/filterParamsFromQuery"
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "TE": "Trailers",
-        }
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        # Responses are cached on disk for 10 minutes, then revalidated with
+        # ETag/Last-Modified so an unchanged CSV costs only a 304
+        self.session = CachedSession(
+            REDFIN_HTTP_CACHE,
+            expire_after=600,
+            stale_if_error=True,
+            allowable_methods=['GET']
+        )
+        self.session.headers.update(DEFAULT_HEADERS)
+        
+        # Keep connections alive across calls and retry transient failures
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+        
+        # Lookups that are repeated across searches for the same area
+        # (bounded, as the connector lives for the whole process)
+        self._location_id_cache = _LRUCache()
+        self._filter_cache = _LRUCache()
+        self._property_details_cache = _LRUCache()
     
     def get_location_id(self, location: str) -> Optional[str]:
         """
@@ -54,6 +292,10 @@ class RedfinConnector:
         Returns:
             Redfin location ID or None if not found
         """
+        location_id = self._location_id_cache.get(location)
+        if location_id is not None:
+            return location_id
+        
         try:
             params = {
                 "location": location,
@@ -70,17 +312,17 @@ class RedfinConnector:
                 "lng": ""
             }
             
-            response = self.session.get(self.search_url)#, params=params)
+            response = self.session.get(SEARCH_URL)#, params=params)
             response.raise_for_status()
             
-            # Parse the response (it's in a special format)
-            data = response.text
-            if not data.startswith("{}&&"):
+            # Check the prefix on the raw bytes before decoding anything
+            data = response.content
+            if not data.startswith(_STINGRAY_PREFIX):
                 logger.warning(f"Unexpected Redfin response format for location: {location}")
                 return None
             
             # Remove the {}&& prefix and parse JSON
-            json_data = json.loads(data[4:])
+            json_data = orjson.loads(data[len(_STINGRAY_PREFIX):])
             
             # Get the exact match or first match
             matches = json_data.get("payload", {}).get("exactMatch", [])
@@ -98,7 +340,7 @@ class RedfinConnector:
             
             # Extract region ID from URL
             if url:
-                region_match = re.search(r"/(\d+)_nb/", url)
+                region_match = _REGION_RE.search(url)
                 if region_match:
                     location_id = region_match.group(1)
             
@@ -107,6 +349,8 @@ class RedfinConnector:
                 location_id = match.get("id", None)
             
             logger.info(f"Found Redfin location ID for {location}: {location_id}")
+            if location_id:
+                self._location_id_cache[location] = location_id
             return location_id
             
         except Exception as e:
@@ -115,7 +359,7 @@ class RedfinConnector:
     
     def get_properties_by_location(self, location: str, max_price: Optional[float] = None, 
                                  property_types: Optional[List[str]] = None,
-                                 status: str = "for-sale") -> List[Dict[str, Any]]:
+                                 status: str = "for-sale") -> pd.DataFrame:
         """
         Get properties from Redfin by location
         
@@ -126,21 +370,13 @@ class RedfinConnector:
             status: Property status ('for-sale', 'sold', etc.)
             
         Returns:
-            List of property dictionaries
+            DataFrame with one row per property
         """
         try:
             # Map property types to Redfin property types
             redfin_property_types = []
             if property_types:
-                mapping = {
-                    "Residential": "1",
-                    "Condo/Co-Op": "2",
-                    "Townhouse": "3",
-                    "Multi-Family": "4",
-                    "Land": "5",
-                    "Other": "6"
-                }
-                redfin_property_types = [mapping.get(pt, "1") for pt in property_types if pt in mapping]
+                redfin_property_types = [REDFIN_PROPERTY_TYPES[pt] for pt in property_types if pt in REDFIN_PROPERTY_TYPES]
             
             if not redfin_property_types:
                 redfin_property_types = ["1", "2"]  # Default to house and condo
@@ -149,7 +385,7 @@ class RedfinConnector:
             location_id = self.get_location_id(location)
             if not location_id:
                 logger.error(f"Could not get Redfin location ID for: {location}")
-                return []
+                return pd.DataFrame()
             
             # Build the search URL
             filters = {
@@ -161,13 +397,17 @@ class RedfinConnector:
                 filters["maxPrice"] = str(int(max_price))
             
             # Get filter parameters
-            filter_params_str = urllib.parse.urlencode(filters)
-            filter_response = self.session.get(f"{self.filter_url}?{filter_params_str}")
-            filter_response.raise_for_status()
-            filter_data = filter_response.json()
+            filter_key = (location_id, tuple(sorted(filters.items())))
+            filter_data = self._filter_cache.get(filter_key)
+            if filter_data is None:
+                filter_params_str = urllib.parse.urlencode(filters)
+                filter_response = self.session.get(f"{FILTER_URL}?{filter_params_str}")
+                filter_response.raise_for_status()
+                filter_data = orjson.loads(filter_response.content)
+                self._filter_cache[filter_key] = filter_data
             
             # The request URL for data in CSV format
-            request_url = f"{self.base_url}/api/gis?al=1&market=false&type=5&v=8"
+            request_url = f"{BASE_URL}/api/gis?al=1&market=false&type=5&v=8"
             request_url += f"&region_id={location_id}&region_type=6&uipt={','.join(redfin_property_types)}"
             
             if max_price:
@@ -176,46 +416,43 @@ class RedfinConnector:
             request_url += "&num_homes=10000&sf=1,2,3,4,5,6,7&status=9"
             
             headers = {
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Accept-Language": "en-US,en;q=0.5",
-                "Connection": "keep-alive",
-                "Host": "www.redfin.com",
-                "Referer": f"{self.base_url}/city/{location_id}/filter/property-type=house+condo",
-                "Upgrade-Insecure-Requests": "1",
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+                **CSV_REQUEST_HEADERS,
+                "Referer": f"{BASE_URL}/city/{location_id}/filter/property-type=house+condo"
             }
             
             response = self.session.get(request_url, headers=headers)
             response.raise_for_status()
             
             # The response contains a download link to the CSV data
-            match = re.search(r'\"url\":\"([^\"]+)\"', response.text)
+            match = _URL_RE.search(response.text)
             if not match:
                 logger.error(f"Could not find CSV download URL in Redfin response for {location}")
-                return []
+                return pd.DataFrame()
             
             download_url = match.group(1).replace("\\u002F", "/")
-            download_url = f"{self.base_url}{download_url}"
-            
-            # Get the CSV data
-            csv_response = self.session.get(download_url)
-            csv_response.raise_for_status()
-            
-            # Parse CSV data into list of dictionaries
-            properties = []
-            csv_data = csv_response.content.decode('utf-8')
-            csv_reader = csv.DictReader(io.StringIO(csv_data))
-            
-            for row in csv_reader:
-                properties.append(dict(row))
+            download_url = f"{BASE_URL}{download_url}"
+            
+            # Stream the CSV straight into pandas' C parser, keeping only the
+            # columns we use (not every Redfin export includes all of them).
+            # The download bypasses the HTTP cache, which would otherwise read
+            # the whole body inside get() in order to store it
+            with self.session.get(download_url, stream=True, timeout=60,
+                                  expire_after=DO_NOT_CACHE) as csv_response:
+                csv_response.raise_for_status()
+                properties = pd.read_csv(
+                    io.BufferedReader(_ResponseStream(csv_response)),
+                    usecols=lambda col: col in REDFIN_COLUMNS,
+                    dtype=REDFIN_DTYPES,
+                    thousands=','
+                )
+            properties = _downcast_redfin_frame(properties)
             
             logger.info(f"Found {len(properties)} properties in Redfin for {location}")
             return properties
             
         except Exception as e:
             logger.error(f"Error getting Redfin properties: {str(e)}")
-            return []
+            return pd.DataFrame()
     
     def get_property_details(self, property_id: str) -> Dict[str, Any]:
         """
@@ -227,78 +464,104 @@ class RedfinConnector:
         Returns:
             Dictionary with property details
         """
+        details = self._property_details_cache.get(property_id)
+        if details is not None:
+            return details
+        
         try:
-            url = f"{self.base_url}/stingray/api/home/details/propertyId/{property_id}"
+            url = f"{BASE_URL}/stingray/api/home/details/propertyId/{property_id}"
             
             response = self.session.get(url)
             response.raise_for_status()
             
-            # Parse the response (it's in a special format)
-            data = response.text
-            if not data.startswith("{}&&"):
+            # Check the prefix on the raw bytes before decoding anything
+            data = response.content
+            if not data.startswith(_STINGRAY_PREFIX):
                 logger.warning(f"Unexpected Redfin response format for property: {property_id}")
                 return {}
             
             # Remove the {}&& prefix and parse JSON
-            json_data = json.loads(data[4:])
+            json_data = orjson.loads(data[len(_STINGRAY_PREFIX):])
             
-            return json_data.get("payload", {})
+            details = json_data.get("payload", {})
+            if details:
+                self._property_details_cache[property_id] = details
+            return details
             
         except Exception as e:
             logger.error(f"Error getting Redfin property details: {str(e)}")
             return {}
     
-    def convert_to_property_objects(self, redfin_properties: List[Dict[str, Any]]) -> List[Property]:
+    def convert_to_property_objects(self, redfin_properties: Union[pd.DataFrame, List[Dict[str, Any]]]) -> List[Property]:
         """
         Convert Redfin property data to Property objects
         
         Args:
-            redfin_properties: List of Redfin property dictionaries
+            redfin_properties: DataFrame (or list of dictionaries) of Redfin properties
             
         Returns:
             List of Property objects
         """
-        properties = []
+        if isinstance(redfin_properties, pd.DataFrame):
+            df = redfin_properties
+        else:
+            df = pd.DataFrame(redfin_properties)
+        
+        # Saved exports use underscores in place of spaces in column names
+        df = df.rename(columns=lambda col: str(col).replace('_', ' ')).reindex(columns=REDFIN_COLUMNS)
         
-        for prop_data in redfin_properties:
+        # Clean and coerce every column in one vectorized pass rather than per row
+        for col, cast in REDFIN_NUMERIC_COLUMNS.items():
+            values = df[col]
+            if values.dtype == object:
+                values = values.astype(str).str.replace(r'[$,]', '', regex=True)
+            df[col] = pd.to_numeric(values, errors='coerce').fillna(0).astype(cast)
+        
+        text_columns = [col for col in REDFIN_COLUMNS if col not in REDFIN_NUMERIC_COLUMNS]
+        df[text_columns] = df[text_columns].astype(object).fillna('')
+        
+        # Find opportunity keywords for the whole batch at once
+        keyword_matches = (df['REMARKS'].astype(str) + ' ' + df['PUBLIC REMARKS'].astype(str)).str.findall(_OPPORTUNITY_RE)
+        
+        # Pre-size the result; rows that fail to convert are trimmed off the end
+        properties = [None] * len(df)
+        count = 0
+        
+        for row, matches in zip(df.itertuples(index=False, name=None), keyword_matches):
             try:
-                # Extract and map data from Redfin format to our Property model
-                
-                # Get address components
-                address = prop_data.get('ADDRESS', '')
-                city = prop_data.get('CITY', '')
-                state = prop_data.get('STATE OR PROVINCE', '')
-                zip_code = prop_data.get('ZIP OR POSTAL CODE', '')
+                (mls_number, listing_id, address, city, state, zip_code, price, beds, baths,
+                 square_feet, lot_size, year_built, days_on_market, remarks, public_remarks,
+                 latitude, longitude, photo) = row
                 
                 # Create property object
                 property_obj = Property(
-                    mls_id=f"REDFIN_{prop_data.get('MLS#', prop_data.get('LISTING ID', ''))}",
+                    mls_id=f"REDFIN_{mls_number or listing_id}",
                     address=address,
                     city=city,
                     state=state,
                     zip_code=zip_code,
-                    list_price=float(prop_data.get('PRICE',0)), #float(prop_data.get('PRICE', '0').replace('$', '').replace(',', '')) if prop_data.get('PRICE') else 0,
-                    bedrooms=int(float(prop_data.get('BEDS', 0))) if prop_data.get('BEDS') else 0,
-                    bathrooms=float(prop_data.get('BATHS', 0)) if prop_data.get('BATHS') else 0,
-                    square_feet=float(prop_data.get('SQUARE FEET', '0').replace(',', '')) if prop_data.get('SQUARE FEET') else 0,
-                    lot_size=prop_data.get('LOT SIZE', ''),
-                    year_built=int(float(prop_data.get('YEAR BUILT', 0))) if prop_data.get('YEAR BUILT') else 0,
-                    days_on_market=int(prop_data.get('DAYS ON MARKET', 0)) if prop_data.get('DAYS ON MARKET') else 0,
-                    description=prop_data.get('REMARKS', ''),
-                    latitude=float(prop_data.get('LATITUDE', 0)) if prop_data.get('LATITUDE') else 0,
-                    longitude=float(prop_data.get('LONGITUDE', 0)) if prop_data.get('LONGITUDE') else 0,
-                    photos=[prop_data.get('PHOTO', '')] if prop_data.get('PHOTO') else []
+                    list_price=price,
+                    bedrooms=beds,
+                    bathrooms=baths,
+                    square_feet=square_feet,
+                    lot_size=lot_size,
+                    year_built=year_built,
+                    days_on_market=days_on_market,
+                    description=remarks,
+                    latitude=latitude,
+                    longitude=longitude,
+                    photos=[photo] if photo else [],
+                    # Keywords that might indicate potential for flipping
+                    opportunity_keywords=list(dict.fromkeys(match.lower() for match in matches))
                 )
                 
-                # Extract keywords that might indicate potential for flipping
-                property_obj.opportunity_keywords = self.extract_opportunity_keywords(prop_data)
-                
-                properties.append(property_obj)
+                properties[count] = property_obj
+                count += 1
             except Exception as e:
                 logger.error(f"Error converting Redfin property data: {str(e)}")
                 continue
         
-        return properties
+        return properties[:count]
     
     def extract_opportunity_keywords(self, prop_data: Dict[str, Any]) -> List[str]:
         """
@@ -310,47 +573,156 @@ class RedfinConnector:
         Returns:
             List of opportunity keywords found
         """
-        keywords = []
-        description = (prop_data.get('REMARKS', '') + ' ' + prop_data.get('PUBLIC REMARKS', '')).lower()
-        
-        opportunity_terms = [
-            'as-is', 'fixer', 'needs work', 'handyman', 'tlc', 'potential', 'opportunity',
-            'estate sale', 'foreclosure', 'bank owned', 'reo', 'short sale', 'distressed',
-            'investor', 'renovation', 'remodel', 'restore', 'flip', 'under market', 'bargain',
-            'motivated', 'must sell', 'bring offer', 'priced to sell', 'reduced'
-        ]
-        
-        for term in opportunity_terms:
-            if term in description:
-                keywords.append(term)
-        
-        return keywords
-    def get_properties_from_csv(self,file_path: str=None ) -> List[Property]:
+        description = prop_data.get('REMARKS', '') + ' ' + prop_data.get('PUBLIC REMARKS', '')
+        return list(dict.fromkeys(match.lower() for match in _OPPORTUNITY_RE.findall(description)))
+    
+    def get_properties_from_csv(self,file_path: str=None ) -> pd.DataFrame:
         """
         Get properties from a CSV file
         """
         #file_path = "https://www.redfin.com/stingray/api/gis-csv?al=3&fixer=true&has_att_fiber=false&has_deal=false&has_dishwasher=false&has_laundry_facility=false&has_laundry_hookups=false&has_parking=false&has_pool=false&has_short_term_lease=false&include_pending_homes=false&isRentals=false&is_furnished=false&is_income_restricted=false&is_senior_living=false&market=dc&num_homes=350&ord=redfin-recommended-asc&page_number=1&poly=-77.119901%2038.791514%2C-76.9095394%2038.791514%2C-76.9095394%2038.9953797%2C-77.119901%2038.9953797%2C-77.119901%2038.791514&pool=false&region_id=12839&region_type=6&sf=1,2,3,5,6,7&status=9&travel_with_traffic=false&travel_within_region=false&uipt=1,3&utilities_included=false&v=8"
         file_path = 'https://www.redfin.com/stingray/api/gis-csv?al=1&market=dc&max_price=500000&min_stories=1&num_homes=350&ord=redfin-recommended-asc&page_number=1&region_id=20065&region_type=6&sf=1,2,3,5,6,7&status=9&uipt=1,2,3,4,5,6&v=8'
-        with requests_html.HTMLSession() as session:
-            from io import StringIO
-            r = session.get(file_path)
-            #r.html.render()
-            df = pd.read_csv(StringIO(r.html.html)).assign(**{"AS of Date":datetime.now().strftime("%Y-%m-%d")})
-            logger.info("fetch data from refin")
-            logger.info(df.head())
-            #df = pd.read_csv(url)
-            df.columns = df.columns.str.strip().str.upper().str.replace(' ', '_').str.replace('(', '').str.replace(')', '')
-            try:
-                all_df = pd.read_csv("data/raw/redfin_properties.csv")
-            except:
-                all_df = pd.DataFrame()
-            try:
-                all_df = pd.concat([all_df,df]).drop_duplicates()
-            except:
-                all_df = df
-            all_df.to_csv("data/raw/redfin_properties.csv",index=False)
+        r = self.session.get(file_path, timeout=30)
+        r.raise_for_status()
+        df = _downcast_redfin_frame(pd.read_csv(io.BytesIO(r.content), thousands=',')).assign(**{"AS of Date":datetime.now().strftime("%Y-%m-%d")})
+        logger.info("fetch data from refin")
+        logger.info(df.head())
+        #df = pd.read_csv(url)
+        df.columns = df.columns.str.strip().str.upper().str.replace(' ', '_').str.replace('(', '').str.replace(')', '')
+        self.append_history(df)
+        
+        return df
+    
+    def append_history(self, df: pd.DataFrame, path: str = REDFIN_HISTORY_DIR,
+                       seen_path: str = REDFIN_SEEN_IDS) -> None:
+        """
+        Append fetched listings to the history dataset without re-reading it
+        
+        Each call writes new Parquet files under the AS_OF_DATE partition.
+        Listings already recorded for the same AS_OF_DATE are skipped by checking
+        the persisted listing keys for that date. Keys for older dates can never
+        match new rows, so they are dropped on write and the file stays the size
+        of one day's fetch rather than growing with the history.
         
-        return df.to_dict(orient='records') 
+        Args:
+            df: Listings to append (normalized column names)
+            path: History dataset directory
+            seen_path: Pickle file mapping AS_OF_DATE to its recorded listing keys
+        """
+        try:
+            if 'MLS#' in df.columns and 'AS_OF_DATE' in df.columns:
+                stored = {}
+                if os.path.exists(seen_path):
+                    with open(seen_path, 'rb') as f:
+                        stored = pickle.load(f)
+                
+                # Earlier versions kept one flat set of keys for every date
+                if isinstance(stored, set):
+                    legacy, stored = stored, {}
+                    for key in legacy:
+                        stored.setdefault(key.rpartition('|')[2], set()).add(key)
+                
+                # Only keys for the dates being written can match
+                dates = df['AS_OF_DATE'].astype(str)
+                seen = {date: set(stored.get(date, ())) for date in dates.unique()}
+                
+                # Fall back to the address for listings without an MLS number
+                listing_ids = df['MLS#'].astype(str)
+                if 'ADDRESS' in df.columns:
+                    listing_ids = listing_ids.where(df['MLS#'].notna(), df['ADDRESS'].astype(str))
+                keys = listing_ids + '|' + dates
+                is_new = ~keys.isin(set().union(*seen.values())) & ~keys.duplicated()
+                df = df[is_new.to_numpy()]
+                if df.empty:
+                    logger.info("No new Redfin listings to add to history")
+                    return
+                for date, date_keys in keys[is_new].groupby(dates[is_new]):
+                    seen[date].update(date_keys)
+            else:
+                seen = None
+            
+            ds.write_dataset(
+                _history_table(df),
+                path,
+                format='parquet',
+                partitioning=['AS_OF_DATE'],
+                partitioning_flavor='hive',
+                basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+                existing_data_behavior='overwrite_or_ignore'
+            )
+            
+            # Record the keys only once their rows are safely written
+            if seen is not None:
+                tmp_path = f"{seen_path}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump(seen, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, seen_path)
+        except Exception as e:
+            logger.error(f"Error appending Redfin history: {str(e)}")
+    
+    def load_history(self, columns: Optional[List[str]] = None, path: str = REDFIN_HISTORY_DIR) -> pd.DataFrame:
+        """
+        Load the listing history, reading only the requested columns
+        
+        Args:
+            columns: Columns to read (all columns if None)
+            path: History dataset directory
+            
+        Returns:
+            DataFrame of historical listings
+        """
+        try:
+            dataset = ds.dataset(path, format='parquet', partitioning='hive', schema=REDFIN_HISTORY_SCHEMA)
+            return dataset.to_table(columns=columns).to_pandas()
+        except Exception as e:
+            logger.error(f"Error loading Redfin history: {str(e)}")
+            return pd.DataFrame()
+    
+    def compact(self, path: str = REDFIN_HISTORY_DIR) -> bool:
+        """
+        Remove duplicate rows from the history dataset
+        
+        The dataset is scanned batch by batch, then rewritten partition by partition.
+        
+        Args:
+            path: History dataset directory
+            
+        Returns:
+            Boolean indicating success
+        """
+        try:
+            dataset = ds.dataset(path, format='parquet', partitioning='hive', schema=REDFIN_HISTORY_SCHEMA)
+            
+            seen = set()
+            unique_chunks = []
+            for batch in dataset.to_batches():
+                chunk = batch.to_pandas()
+                row_hashes = pd.util.hash_pandas_object(chunk, index=False)
+                is_new = ~row_hashes.isin(seen) & ~row_hashes.duplicated()
+                seen.update(row_hashes[is_new])
+                unique_chunks.append(chunk[is_new.to_numpy()])
+            
+            if not unique_chunks:
+                return True
+            
+            ds.write_dataset(
+                _history_table(pd.concat(unique_chunks, ignore_index=True)),
+                path,
+                format='parquet',
+                partitioning=['AS_OF_DATE'],
+                partitioning_flavor='hive',
+                existing_data_behavior='delete_matching'
+            )
+            logger.info(f"Compacted Redfin history to {len(seen)} unique rows")
+            return True
+        except Exception as e:
+            logger.error(f"Error compacting Redfin history: {str(e)}")
+            return False
+
+@functools.lru_cache(maxsize=1)
+def _get_connector() -> RedfinConnector:
+    """Shared connector, so its HTTP session and lookup caches persist between searches"""
+    return RedfinConnector()
 
 def get_properties(location: str, max_price: Optional[float] = None, 
                    property_types: Optional[List[str]] = None) -> List[Property]:
@@ -365,7 +737,7 @@ def get_properties(location: str, max_price: Optional[float] = None,
     Returns:
         List of Property objects
     """
-    connector = RedfinConnector()
+    connector = _get_connector()
     redfin_properties = connector.get_properties_from_csv()
     
     return connector.convert_to_property_objects(redfin_properties)
@@ -6,27 +6,29 @@ Real Estate Flip Finder - Main Entry Point
 import os
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from config import settings
-from data import mls_connector, redfin_connector, public_records, market_data
-from analysis import property_scorer, deal_analyzer
-from visualization import dashboard
-from utils import excel_exporter, notification
+
+# Data, analysis and output modules pull in pandas, requests, openpyxl etc.,
+# so they are imported where they are first needed to keep --help fast
 
 # Set up logging
-def setup_logging():
+def setup_logging(stamp: str = None):
+    if stamp is None:
+        stamp = datetime.now().strftime('%Y%m%d')
     logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(f"logs/flip_finder_{datetime.now().strftime('%Y%m%d')}.log"),
+        logging.FileHandler(f"logs/flip_finder_{stamp}.log"),
             logging.StreamHandler()
         ]
     )
     return logging.getLogger(__name__)
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
 def create_directories():
     """Create necessary directories if they don't exist"""
@@ -53,48 +55,65 @@ def get_properties_from_source(source, area, max_price, days_on_market, property
     properties = []
     
     if source in ['mls', 'both']:
+        from data import mls_connector
+    if source in ['redfin', 'both']:
+        from data import redfin_connector
+    
+    def fetch_mls():
         logger.info("Fetching property listings from Bright MLS...")
-        mls_properties = mls_connector.get_properties(
+        return mls_connector.get_properties(
             area=area,
             max_price=max_price,
             days_on_market=days_on_market,
             property_types=property_types
         )
-        properties.extend(mls_properties)
-        logger.info(f"Found {len(mls_properties)} properties from MLS matching initial criteria")
     
-    if source in ['redfin', 'both']:
+    def fetch_redfin():
         logger.info("Fetching property listings from Redfin...")
-        redfin_properties = redfin_connector.get_properties(
+        return redfin_connector.get_properties(
             location=area,
             max_price=max_price,
             property_types=property_types
         )
+    
+    # Both sources are I/O bound, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        mls_future = executor.submit(fetch_mls) if source in ['mls', 'both'] else None
+        redfin_future = executor.submit(fetch_redfin) if source in ['redfin', 'both'] else None
+    
+    if mls_future is not None:
+        mls_properties = mls_future.result()
+        properties.extend(mls_properties)
+        logger.info(f"Found {len(mls_properties)} properties from MLS matching initial criteria")
+    
+    if redfin_future is not None:
+        redfin_properties = redfin_future.result()
         properties.extend(redfin_properties)
         logger.info(f"Found {len(redfin_properties)} properties from Redfin matching initial criteria")
     
-    # De-duplicate properties if using both sources (simple deduplication by address)
+    # De-duplicate properties if using both sources, keyed on the address with
+    # case and whitespace normalized (first source wins)
     if source == 'both':
-        unique_addresses = set()
-        unique_properties = []
+        unique_properties = {}
         
         for prop in properties:
-            if prop.address not in unique_addresses:
-                unique_addresses.add(prop.address)
-                unique_properties.append(prop)
+            unique_properties.setdefault(' '.join((prop.address or '').upper().split()), prop)
         
-        logger.info(f"After deduplication: {len(unique_properties)} unique properties")
-        properties = unique_properties
+        properties = list(unique_properties.values())
+        logger.info(f"After deduplication: {len(properties)} unique properties")
     
     return properties
 
 def main():
     """Main execution function"""
-    create_directories()
-    logger = setup_logging()
-    
     args = parse_arguments()
     
+    # One timestamp per run so the log and output file names always agree
+    stamp = datetime.now().strftime('%Y%m%d')
+    
+    create_directories()
+    logger = setup_logging(stamp)
+    
     logger.info("Starting Real Estate Flip Finder")
     logger.info(f"Search parameters: Area={args.area}, Budget=${args.budget}, ROI={args.roi}%, Source={args.source}")
     
@@ -114,32 +133,25 @@ def main():
     
     # 2. Enrich with additional data
     logger.info("Enriching property data...")
-    for prop in properties:
+    from data import public_records, market_data
+    from utils.rng import spawn_rngs
+    
+    def enrich(prop, rng):
         # Add public records data
         public_records.enrich_property(prop)
         # Add market data
-        market_data.add_comps(prop)
+        market_data.add_comps(prop, rng=rng)
+    
+    # Enrichment is I/O bound per property, so overlap the lookups. Each property
+    # gets its own generator, so a seeded run is reproducible under any scheduling
+    with ThreadPoolExecutor(max_workers=settings.ENRICHMENT_WORKERS) as executor:
+        list(executor.map(enrich, properties, spawn_rngs(len(properties))))
     
     # 3. Analyze deals
     logger.info("Analyzing potential deals...")
-    deals = []
-    for prop in properties:
-        # Estimate repair costs
-        repair_costs = deal_analyzer.estimate_repairs(prop)
-        
-        # Calculate ARV
-        arv = deal_analyzer.calculate_arv(prop)
-        
-        # Calculate potential profit
-        deal = deal_analyzer.analyze_deal(
-            property_data=prop,
-            arv=arv,
-            repair_costs=repair_costs,
-            min_roi=args.roi
-        )
-        
-        if deal['meets_criteria']:
-            deals.append(deal)
+    from analysis import property_scorer, deal_analyzer
+    
+    deals = deal_analyzer.analyze_deals(properties, min_roi=args.roi)
     
     logger.info(f"Found {len(deals)} viable deals")
     
@@ -150,20 +162,23 @@ def main():
     # 5. Output results
     if args.export:
         logger.info("Exporting results to Excel...")
+        from utils import excel_exporter
         excel_exporter.export_deals(
             scored_deals, 
-            f"output/excel/potential_deals_{datetime.now().strftime('%Y%m%d')}.xlsx"
+            f"output/excel/potential_deals_{stamp}.xlsx"
         )
     
     if args.visualize:
         logger.info("Generating visualizations...")
+        from visualization import dashboard
         dashboard.generate_dashboard(
             scored_deals, 
-            f"output/dashboards/dashboard_{datetime.now().strftime('%Y%m%d')}.html"
+            f"output/dashboards/dashboard_{stamp}.html"
         )
     
     if args.notify and deals:
         logger.info("Sending notification...")
+        from utils import notification
         notification.send_email(
             subject=f"Found {len(deals)} potential flip properties",
             deals=scored_deals[:10]  # Send top 10 deals
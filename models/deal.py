@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class Deal:
     """Class for storing real estate deal data"""
     property_id: str
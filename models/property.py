@@ -5,8 +5,26 @@ Property - Data model for real estate properties
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+import time
 
-@dataclass
+# Year used for property ages, and the timestamp at which it ends
+_CURRENT_YEAR = 0
+_YEAR_ENDS_AT = 0.0
+
+def _current_year() -> int:
+    """
+    Current year, re-read only once the cached year has ended
+    
+    A time.time() comparison is much cheaper than building a datetime for every
+    property, and long-running apps still roll over at New Year.
+    """
+    global _CURRENT_YEAR, _YEAR_ENDS_AT
+    if time.time() >= _YEAR_ENDS_AT:
+        _CURRENT_YEAR = datetime.now().year
+        _YEAR_ENDS_AT = datetime(_CURRENT_YEAR + 1, 1, 1).timestamp()
+    return _CURRENT_YEAR
+
+@dataclass(slots=True)
 class Property:
     """Class for storing property data"""
     mls_id: str
@@ -40,20 +58,23 @@ class Property:
     estimated_profit: float = 0.0
     estimated_roi: float = 0.0
     
+    # Derived fields, set in __post_init__
+    price_per_sqft: float = field(default=0.0, init=False)
+    age: Optional[int] = field(default=None, init=False)
+    
     def __post_init__(self):
         """Validate and set defaults for the property"""
         # Ensure numeric fields are correct type
-        self.list_price = float(self.list_price)
-        self.square_feet = float(self.square_feet)
+        self.list_price = list_price = float(self.list_price)
+        self.square_feet = square_feet = float(self.square_feet)
         self.bedrooms = int(self.bedrooms) if self.bedrooms else 0
-        self.year_built = int(self.year_built) if self.year_built else 0
+        self.year_built = year_built = int(self.year_built) if self.year_built else 0
         
         # Calculate price per square foot
-        self.price_per_sqft = round(self.list_price / self.square_feet, 2) if self.square_feet else 0
+        self.price_per_sqft = round(list_price / square_feet, 2) if square_feet else 0
         
         # Property age
-        current_year = datetime.now().year
-        self.age = current_year - self.year_built if self.year_built > 0 else None
+        self.age = _current_year() - year_built if year_built > 0 else None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert property to dictionary for serialization"""
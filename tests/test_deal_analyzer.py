@@ -0,0 +1,77 @@
+"""
+Tests for the batch deal analysis against the per-property functions
+"""
+
+import math
+from datetime import datetime
+
+from analysis import deal_analyzer
+from models.property import Property
+
+def make_property(mls_id, square_feet, year_built, keywords, bathrooms=2.0, comps=None):
+    """Build a property for analysis"""
+    return Property(
+        mls_id=mls_id,
+        address=f"{mls_id} Main St",
+        city="Washington",
+        state="DC",
+        zip_code="20001",
+        list_price=150000,
+        bedrooms=3,
+        bathrooms=bathrooms,
+        square_feet=square_feet,
+        lot_size=0,
+        year_built=year_built,
+        days_on_market=10,
+        description="",
+        opportunity_keywords=keywords,
+        comps=comps or []
+    )
+
+def mixed_batch():
+    """Properties covering each branch of the repair and deal model"""
+    comps = [{'price': 300000, 'square_feet': 1500}, {'price': 330000, 'square_feet': 1600}]
+    return [
+        make_property("UNKNOWN_AGE", 1800, None, ['fixer']),
+        make_property("NEW", 1600, datetime.now().year - 10, []),
+        make_property("HIGH_REPAIR", 2400, 1950, ['needs work', 'dated'], comps=comps),
+        make_property("MODERATE_REPAIR", 1200, 1985, ['update'], bathrooms=3.5),
+        make_property("NO_SQFT", 0, 1970, ['tlc'], bathrooms=None),
+    ]
+
+def test_analyze_deals_matches_scalar_functions():
+    """Every property gets the same numbers from the batch as from estimate_repairs/analyze_deal"""
+    expected = {}
+    for prop in mixed_batch():
+        repair_costs = deal_analyzer.estimate_repairs(prop)
+        arv = deal_analyzer.calculate_arv(prop)
+        expected[prop.mls_id] = deal_analyzer.analyze_deal(prop, arv, repair_costs, min_roi=-math.inf)
+    
+    deals = deal_analyzer.analyze_deals(mixed_batch(), min_roi=-math.inf)
+    
+    assert [deal['property_id'] for deal in deals] == list(expected)
+    for deal in deals:
+        scalar_deal = expected[deal['property_id']]
+        assert deal.keys() == scalar_deal.keys()
+        for key, value in deal.items():
+            if isinstance(value, float):
+                assert math.isclose(value, scalar_deal[key], rel_tol=1e-9), (deal['property_id'], key)
+            else:
+                assert value == scalar_deal[key], (deal['property_id'], key)
+
+def test_analyze_deals_filters_on_min_roi():
+    """Only properties meeting the ROI threshold are returned, but all get estimates"""
+    properties = mixed_batch()
+    rois = {}
+    for prop in mixed_batch():
+        deal = deal_analyzer.analyze_deal(
+            prop, deal_analyzer.calculate_arv(prop), deal_analyzer.estimate_repairs(prop)
+        )
+        rois[prop.mls_id] = deal['roi']
+    min_roi = sorted(rois.values())[2]
+    
+    deals = deal_analyzer.analyze_deals(properties, min_roi=min_roi)
+    
+    assert {deal['property_id'] for deal in deals} == {mls_id for mls_id, roi in rois.items() if roi >= min_roi}
+    for prop in properties:
+        assert math.isclose(prop.estimated_roi, rois[prop.mls_id], rel_tol=1e-9)
@@ -0,0 +1,63 @@
+"""
+JIT Kernels - Optional Numba-compiled loops for large numeric arrays
+
+Numba is optional. When it is not installed NUMBA_AVAILABLE is False and
+callers use their NumPy implementation instead.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many array cells the NumPy path is as fast as the threaded kernels
+JIT_MIN_CELLS = 1_000_000
+
+if NUMBA_AVAILABLE:
+    # fastmath is deliberately off: it assumes no NaNs, and missing values must
+    # compare False exactly as they do in NumPy
+    
+    @njit(parallel=True, cache=True)
+    def zscore_mask(arr: np.ndarray, mean: np.ndarray, std: np.ndarray,
+                    threshold: float, out: np.ndarray) -> None:
+        """
+        Flag cells whose absolute z-score exceeds the threshold, writing into out
+        
+        Columns with zero or NaN std are never flagged, nor are NaN cells.
+        
+        Args:
+            arr: 2D float64 array (rows x columns)
+            mean: Per-column mean
+            std: Per-column standard deviation
+            threshold: Z-score threshold
+            out: 2D boolean array with the same shape as arr
+        """
+        n_rows, n_cols = arr.shape
+        for i in prange(n_rows):
+            for j in range(n_cols):
+                out[i, j] = std[j] > 0 and abs((arr[i, j] - mean[j]) / std[j]) > threshold
+    
+    @njit(parallel=True, cache=True)
+    def minmax_scale(arr: np.ndarray, min_vals: np.ndarray, ranges: np.ndarray,
+                     out: np.ndarray) -> None:
+        """
+        Min-max scale each column to 0-1, writing into out
+        
+        Columns without a positive range are set to 0.
+        
+        Args:
+            arr: 2D float64 array (rows x columns)
+            min_vals: Per-column minimum
+            ranges: Per-column max - min
+            out: 2D float64 array with the same shape as arr
+        """
+        n_rows, n_cols = arr.shape
+        for i in prange(n_rows):
+            for j in range(n_cols):
+                if ranges[j] > 0:
+                    out[i, j] = (arr[i, j] - min_vals[j]) / ranges[j]
+                else:
+                    out[i, j] = 0.0
@@ -2,14 +2,66 @@
 Data Cleaner - Clean and normalize property data
 """
 
+from __future__ import annotations
+
 import logging
 import re
-import pandas as pd
-import numpy as np
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Union, TYPE_CHECKING
+
+# pandas/numpy are imported inside the functions that need them, so the
+# string cleaners can be used without loading them
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Address words and their standard abbreviations
+STREET_ABBREVIATIONS = {
+    'AVENUE': 'AVE',
+    'BOULEVARD': 'BLVD',
+    'CIRCLE': 'CIR',
+    'COURT': 'CT',
+    'DRIVE': 'DR',
+    'LANE': 'LN',
+    'PLACE': 'PL',
+    'ROAD': 'RD',
+    'STREET': 'ST',
+    'WAY': 'WAY',
+    'TERRACE': 'TER',
+    'NORTH': 'N',
+    'SOUTH': 'S',
+    'EAST': 'E',
+    'WEST': 'W',
+    'APARTMENT': 'APT',
+    'SUITE': 'STE',
+    'UNIT': 'UNIT'
+}
+
+# Abbreviations whose trailing period is dropped at the end of an address
+TRAILING_ABBREVIATIONS = ['AVE', 'BLVD', 'CIR', 'CT', 'DR', 'LN', 'PL', 'RD', 'ST', 'TER',
+                          'N', 'S', 'E', 'W', 'APT', 'STE']
+
+# Numeric property fields and the type each is coerced to
+NUMERIC_FIELDS = {
+    'list_price': float,
+    'square_feet': float,
+    'bedrooms': int,
+    'bathrooms': float,
+    'year_built': int
+}
+
+# Compiled once so each address is scanned in a single pass per rule
+_STREET_WORD_RE = re.compile(
+    r'\b(' + '|'.join(sorted(STREET_ABBREVIATIONS, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
+_TRAILING_ABBREVIATION_RE = re.compile(
+    r'\b(' + '|'.join(sorted(TRAILING_ABBREVIATIONS, key=len, reverse=True)) + r')\.$',
+    re.IGNORECASE
+)
+_WS_RE = re.compile(r'\s+')
+_ZIP_RE = re.compile(r'\d{5}')
+
 def clean_address(address: str) -> str:
     """
     Clean and standardize property address
@@ -27,48 +79,11 @@ def clean_address(address: str) -> str:
     address = str(address)
     
     # Remove extra whitespace
-    address = re.sub(r'\s+', ' ', address).strip()
-    
-    # Standardize abbreviations
-    replacements = {
-        r'\bAVENUE\b': 'AVE',
-        r'\bAVE\.$': 'AVE',
-        r'\bBOULEVARD\b': 'BLVD',
-        r'\bBLVD\.$': 'BLVD',
-        r'\bCIRCLE\b': 'CIR',
-        r'\bCIR\.$': 'CIR',
-        r'\bCOURT\b': 'CT',
-        r'\bCT\.$': 'CT',
-        r'\bDRIVE\b': 'DR',
-        r'\bDR\.$': 'DR',
-        r'\bLANE\b': 'LN',
-        r'\bLN\.$': 'LN',
-        r'\bPLACE\b': 'PL',
-        r'\bPL\.$': 'PL',
-        r'\bROAD\b': 'RD',
-        r'\bRD\.$': 'RD',
-        r'\bSTREET\b': 'ST',
-        r'\bST\.$': 'ST',
-        r'\bWAY\b': 'WAY',
-        r'\bTERRACE\b': 'TER',
-        r'\bTER\.$': 'TER',
-        r'\bNORTH\b': 'N',
-        r'\bSOUTH\b': 'S',
-        r'\bEAST\b': 'E',
-        r'\bWEST\b': 'W',
-        r'\bN\.$': 'N',
-        r'\bS\.$': 'S',
-        r'\bE\.$': 'E',
-        r'\bW\.$': 'W',
-        r'\bAPARTMENT\b': 'APT',
-        r'\bAPT\.$': 'APT',
-        r'\bSUITE\b': 'STE',
-        r'\bSTE\.$': 'STE',
-        r'\bUNIT\b': 'UNIT'
-    }
-    
-    for pattern, replacement in replacements.items():
-        address = re.sub(pattern, replacement, address, flags=re.IGNORECASE)
+    address = _WS_RE.sub(' ', address).strip()
+    
+    # Standardize abbreviations, then drop a trailing period after one
+    address = _STREET_WORD_RE.sub(lambda m: STREET_ABBREVIATIONS[m.group(1).upper()], address)
+    address = _TRAILING_ABBREVIATION_RE.sub(lambda m: m.group(1).upper(), address)
     
     return address
 
@@ -76,52 +91,56 @@ def clean_property_data(properties: List[Any]) -> List[Any]:
     """
     Clean and standardize property data
     
+    Dictionaries are cleaned together in one DataFrame pass; property objects
+    are passed through unchanged.
+    
     Args:
         properties: List of property objects or dictionaries
         
     Returns:
         List of cleaned property objects/dictionaries
     """
-    clean_properties = []
-    
-    for prop in properties:
-        try:
-            # Create a copy of the property data
-            clean_prop = prop.copy() if isinstance(prop, dict) else prop
-            
-            # Clean address if it's a dictionary
-            if isinstance(clean_prop, dict):
-                if 'address' in clean_prop:
-                    clean_prop['address'] = clean_address(clean_prop['address'])
-                
-                # Ensure numeric values are correct type
-                numeric_fields = ['list_price', 'square_feet', 'bedrooms', 'bathrooms', 'year_built']
-                for field in numeric_fields:
-                    if field in clean_prop:
-                        try:
-                            if field in ['bedrooms', 'year_built']:
-                                clean_prop[field] = int(float(clean_prop[field])) if clean_prop[field] else 0
-                            elif field == 'bathrooms':
-                                clean_prop[field] = float(clean_prop[field]) if clean_prop[field] else 0
-                            else:
-                                clean_prop[field] = float(clean_prop[field]) if clean_prop[field] else 0
-                        except (ValueError, TypeError):
-                            if field in ['bedrooms', 'year_built']:
-                                clean_prop[field] = 0
-                            elif field == 'bathrooms':
-                                clean_prop[field] = 0.0
-                            else:
-                                clean_prop[field] = 0.0
-            
-            clean_properties.append(clean_prop)
+    clean_properties = list(properties)
+    dict_positions = [i for i, prop in enumerate(properties) if isinstance(prop, dict)]
+    if not dict_positions:
+        return clean_properties
+    
+    try:
+        import numpy as np
+        import pandas as pd
+        
+        df = pd.DataFrame([properties[i] for i in dict_positions])
+        
+        cleaned_columns = {}
+        if 'address' in df.columns:
+            cleaned_columns['address'] = df['address'].map(clean_address).tolist()
         
-        except Exception as e:
-            logger.error(f"Error cleaning property data: {str(e)}")
-            # Add the original property data if cleaning fails
-            clean_properties.append(prop)
+        # Ensure numeric values are the correct type (missing or invalid values become 0)
+        for field, cast in NUMERIC_FIELDS.items():
+            if field in df.columns:
+                values = pd.to_numeric(df[field], errors='coerce').replace([np.inf, -np.inf], np.nan).fillna(0)
+                cleaned_columns[field] = values.astype('int64' if cast is int else 'float64').tolist()
+        
+        # Write cleaned values back to copies, only for keys each property already has
+        for row, i in enumerate(dict_positions):
+            clean_prop = properties[i].copy()
+            for field, values in cleaned_columns.items():
+                if field in clean_prop:
+                    clean_prop[field] = values[row]
+            clean_properties[i] = clean_prop
+    
+    except Exception as e:
+        logger.error(f"Error cleaning property data: {str(e)}")
+        # Return the original property data if cleaning fails
+        return list(properties)
     
     return clean_properties
 
+def _numeric_columns(df: pd.DataFrame, columns: List[str]) -> List[str]:
+    """Requested columns present in the DataFrame with an int64/float64 dtype, in order"""
+    return [col for col in dict.fromkeys(columns)
+            if col in df.columns and df[col].dtype in ['int64', 'float64']]
+
 def detect_outliers(df: pd.DataFrame, columns: List[str], threshold: float = 3.0) -> pd.DataFrame:
     """
     Detect outliers in specified columns using z-score
@@ -134,15 +153,35 @@ def detect_outliers(df: pd.DataFrame, columns: List[str], threshold: float = 3.0
     Returns:
         DataFrame with outlier flags
     """
+    import numpy as np
+    import pandas as pd
+    from utils import _jit_kernels
+    
     result_df = df.copy()
     
-    for col in columns:
-        if col in df.columns and df[col].dtype in ['int64', 'float64']:
-            # Calculate z-scores
-            z_scores = np.abs((df[col] - df[col].mean()) / df[col].std())
-            
-            # Flag outliers
-            result_df[f'{col}_outlier'] = z_scores > threshold
+    num_cols = _numeric_columns(df, columns)
+    if not num_cols:
+        return result_df
+    
+    # Z-scores for all columns at once (NaNs are skipped and never flagged)
+    values = df[num_cols]
+    arr = values.to_numpy(dtype=np.float64)
+    mean = values.mean().to_numpy(dtype=np.float64)
+    std = values.std().to_numpy(dtype=np.float64)
+    
+    if _jit_kernels.NUMBA_AVAILABLE and arr.size >= _jit_kernels.JIT_MIN_CELLS:
+        # Large tables: one threaded pass with no (rows x columns) temporaries
+        flags = np.empty(arr.shape, dtype=np.bool_)
+        _jit_kernels.zscore_mask(np.ascontiguousarray(arr), mean, std, threshold, flags)
+    else:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_scores = np.abs((arr - mean) / std)
+        
+        # Constant (or single-value) columns have no outliers
+        flags = (z_scores > threshold) & (std > 0)
+    
+    flag_cols = [f'{col}_outlier' for col in num_cols]
+    result_df[flag_cols] = pd.DataFrame(flags, columns=flag_cols, index=df.index)
     
     return result_df
 
@@ -157,17 +196,32 @@ def normalize_numerical_features(df: pd.DataFrame, columns: List[str]) -> pd.Dat
     Returns:
         DataFrame with normalized columns
     """
+    import numpy as np
+    import pandas as pd
+    from utils import _jit_kernels
+    
     result_df = df.copy()
     
-    for col in columns:
-        if col in df.columns and df[col].dtype in ['int64', 'float64']:
-            min_val = df[col].min()
-            max_val = df[col].max()
-            
-            if max_val > min_val:
-                result_df[f'{col}_normalized'] = (df[col] - min_val) / (max_val - min_val)
-            else:
-                result_df[f'{col}_normalized'] = 0.0
+    num_cols = _numeric_columns(df, columns)
+    if not num_cols:
+        return result_df
+    
+    # Min-max scale all columns at once; constant columns become 0
+    values = df[num_cols]
+    arr = values.to_numpy(dtype=np.float64)
+    min_vals = values.min().to_numpy(dtype=np.float64)
+    ranges = values.max().to_numpy(dtype=np.float64) - min_vals
+    
+    if _jit_kernels.NUMBA_AVAILABLE and arr.size >= _jit_kernels.JIT_MIN_CELLS:
+        normalized = np.empty(arr.shape, dtype=np.float64)
+        _jit_kernels.minmax_scale(np.ascontiguousarray(arr), min_vals, ranges, normalized)
+    else:
+        varying = ranges > 0
+        normalized = np.zeros_like(arr)
+        normalized[:, varying] = (arr[:, varying] - min_vals[varying]) / ranges[varying]
+    
+    norm_cols = [f'{col}_normalized' for col in num_cols]
+    result_df[norm_cols] = pd.DataFrame(normalized, columns=norm_cols, index=df.index)
     
     return result_df
 
@@ -188,7 +242,7 @@ def clean_zip_code(zip_code: Union[str, int]) -> str:
     zip_str = str(zip_code).strip()
     
     # Extract the first 5 digits
-    match = re.search(r'^\d{5}', zip_str)
+    match = _ZIP_RE.match(zip_str)
     if match:
         return match.group(0)
     
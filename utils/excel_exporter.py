@@ -3,15 +3,60 @@ Excel Exporter - Export deal analysis to Excel
 """
 
 import logging
-import pandas as pd
 import os
-from openpyxl import load_workbook
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
-from openpyxl.chart import BarChart, Reference
 
 logger = logging.getLogger(__name__)
 
+# ROI highlight rules, highest priority first: (criteria, threshold, fill color)
+ROI_FILLS = [
+    ('>=', 30, '#90EE90'),  # Light green
+    ('>=', 20, '#FFFFE0'),  # Light yellow
+    ('<', 20, '#FFC0CB')    # Light pink
+]
+
+# Deal Analysis columns (0-based) that are centered: Score, Boolean, and count columns
+CENTERED_COLUMNS = {0, 10, 11, 12, 13, 14, 18}
+
+# Rows sampled when sizing columns
+WIDTH_SAMPLE_ROWS = 500
+
+# Deal Analysis sheet columns, in order: (header, deal key)
+DEAL_COLUMNS = [
+    ('Score', 'score'),
+    ('Address', 'address'),
+    ('List Price', 'list_price'),
+    ('ARV', 'arv'),
+    ('Repair Costs', 'repair_costs'),
+    ('Closing Costs', 'closing_costs'),
+    ('Holding Costs', 'holding_costs'),
+    ('Total Investment', 'total_project_cost'),
+    ('Profit', 'potential_profit'),
+    ('ROI (%)', 'roi'),
+    ('Max Purchase Price (70% Rule)', 'max_purchase_price'),
+    ('Meets 70% Rule', 'meets_70_percent_rule')
+]
+
+# Followed by these, taken from each deal's property data: (header, property key)
+PROPERTY_COLUMNS = [
+    ('DOM', 'days_on_market'),
+    ('Bedrooms', 'bedrooms'),
+    ('Bathrooms', 'bathrooms'),
+    ('Square Feet', 'square_feet'),
+    ('Year Built', 'year_built'),
+    ('Price/SqFt', 'price_per_sqft')
+]
+
+def _add_formats(workbook):
+    """Create the cell formats used by the export, once per workbook"""
+    return {
+        'header': workbook.add_format({'bold': True, 'bg_color': '#CCCCCC', 'align': 'center', 'border': 1}),
+        'data': workbook.add_format({'border': 1}),
+        'centered': workbook.add_format({'align': 'center'}),
+        'money': workbook.add_format({'border': 1, 'num_format': '$#,##0.00'}),
+        'percent': workbook.add_format({'border': 1, 'num_format': '0.00"%"'}),
+        'roi': [workbook.add_format({'bg_color': color}) for _, _, color in ROI_FILLS]
+    }
+
 def export_deals(deals, output_file):
     """Export deals to Excel with formatting and charts"""
     if not deals:
@@ -19,184 +64,132 @@ def export_deals(deals, output_file):
         return False
     
     try:
-        # Convert deals to DataFrame
-        df = pd.DataFrame([
-            {
-                'Score': deal['score'],
-                'Address': deal['address'],
-                'List Price': deal['list_price'],
-                'ARV': deal['arv'],
-                'Repair Costs': deal['repair_costs'],
-                'Closing Costs': deal['closing_costs'],
-                'Holding Costs': deal['holding_costs'],
-                'Total Investment': deal['total_project_cost'],
-                'Profit': deal['potential_profit'],
-                'ROI (%)': deal['roi'],
-                'Max Purchase Price (70% Rule)': deal['max_purchase_price'],
-                'Meets 70% Rule': deal['meets_70_percent_rule'],
-                'DOM': deal['property_data']['days_on_market'],
-                'Bedrooms': deal['property_data']['bedrooms'],
-                'Bathrooms': deal['property_data']['bathrooms'],
-                'Square Feet': deal['property_data']['square_feet'],
-                'Year Built': deal['property_data']['year_built'],
-                'Price/SqFt': deal['property_data']['price_per_sqft']
-            } for deal in deals
-        ])
+        # Imported here so loading this module doesn't pull in pandas
+        import pandas as pd
+        import pyarrow as pa
+        
+        # Build the DataFrame column by column
+        property_data = [deal['property_data'] for deal in deals]
+        columns = {header: [deal[key] for deal in deals] for header, key in DEAL_COLUMNS}
+        columns.update({header: [data[key] for data in property_data] for header, key in PROPERTY_COLUMNS})
+        columns['Meets Criteria'] = [deal.get('meets_criteria', False) for deal in deals]
+        
+        # Arrow-backed columns keep strings in contiguous buffers instead of
+        # one Python object per row
+        try:
+            df = pa.Table.from_pydict(columns).to_pandas(types_mapper=pd.ArrowDtype)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Columns with mixed value types Arrow can't unify
+            df = pd.DataFrame(columns)
         
         # Ensure output directory exists
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
         
-        # Save to Excel
-        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+        # Save to Excel (xlsxwriter streams the sheet out; formats are created once and shared)
+        with pd.ExcelWriter(output_file, engine='xlsxwriter') as writer:
             # Write main data
             df.to_excel(writer, sheet_name='Deal Analysis', index=False)
             
             # Access the workbook and the worksheet
             workbook = writer.book
             worksheet = writer.sheets['Deal Analysis']
-            
-            # Set column widths
-            for idx, col in enumerate(df.columns):
-                column_width = max(
-                    df[col].astype(str).map(len).max(),
-                    len(col)
-                ) + 2
-                worksheet.column_dimensions[get_column_letter(idx+1)].width = min(column_width, 30)
-            
-            # Add formatting
-            header_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
-            header_font = Font(bold=True)
-            centered_alignment = Alignment(horizontal='center')
-            border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
+            formats = _add_formats(workbook)
+            last_row = len(df)
+            last_col = len(df.columns) - 1
             
             # Format headers
-            for cell in worksheet[1]:
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = centered_alignment
-                cell.border = border
-            
-            # Format data cells
-            for row in worksheet.iter_rows(min_row=2, max_row=len(df)+1, min_col=1, max_col=len(df.columns)):
-                for cell in row:
-                    cell.border = border
-                    
-                    # Center specific columns
-                    if cell.column in [1, 11, 12, 13, 14, 15]:  # Score, Boolean, and count columns
-                        cell.alignment = centered_alignment
-                    
-                    # Color ROI cells based on value
-                    if cell.column == 10:  # ROI column
-                        try:
-                            roi_value = float(cell.value)
-                            if roi_value >= 30:
-                                cell.fill = PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid")  # Light green
-                            elif roi_value >= 20:
-                                cell.fill = PatternFill(start_color="FFFFE0", end_color="FFFFE0", fill_type="solid")  # Light yellow
-                            else:
-                                cell.fill = PatternFill(start_color="FFC0CB", end_color="FFC0CB", fill_type="solid")  # Light pink
-                        except (ValueError, TypeError):
-                            pass
-            
-            # Add a bar chart for top properties by profit
-            chart_sheet = workbook.create_sheet(title='Charts')
-            
-            profit_chart = BarChart()
-            profit_chart.title = "Top Properties by Potential Profit"
-            profit_chart.y_axis.title = "Profit ($)"
-            profit_chart.x_axis.title = "Property"
-            
-            # Get top 10 properties by profit
-            top_profits = df.sort_values('Profit', ascending=False).head(10)
-            
-            # Create references to data
-            address_data = Reference(worksheet, min_col=2, min_row=2, max_row=min(11, len(df)+1))
-            profit_data = Reference(worksheet, min_col=9, min_row=1, max_row=min(11, len(df)+1))
+            for idx, col in enumerate(df.columns):
+                worksheet.write(0, idx, col, formats['header'])
             
-            profit_chart.add_data(profit_data, titles_from_data=True)
-            profit_chart.set_categories(address_data)
+            # Set column widths from a sample of rows (widths are capped anyway),
+            # centering specific columns
+            sample_widths = df.head(WIDTH_SAMPLE_ROWS).astype(str).apply(lambda values: values.str.len().max())
+            for idx, col in enumerate(df.columns):
+                column_width = max(int(sample_widths[col]), len(col)) + 2
+                column_format = formats['centered'] if idx in CENTERED_COLUMNS else None
+                worksheet.set_column(idx, idx, min(column_width, 30), column_format)
+            
+            # Border every data cell
+            worksheet.conditional_format(1, 0, last_row, last_col, {'type': 'no_errors', 'format': formats['data']})
+            
+            # Color ROI cells based on value
+            roi_col = df.columns.get_loc('ROI (%)')
+            for (criteria, value, _), roi_format in zip(ROI_FILLS, formats['roi']):
+                worksheet.conditional_format(1, roi_col, last_row, roi_col, {
+                    'type': 'cell',
+                    'criteria': criteria,
+                    'value': value,
+                    'format': roi_format,
+                    'stop_if_true': True
+                })
+            
+            # Add a bar chart of profit for the first (top-scored) 10 properties
+            chart_sheet = workbook.add_worksheet('Charts')
+            chart_rows = min(10, last_row)
+            address_col = df.columns.get_loc('Address')
+            
+            profit_col = df.columns.get_loc('Profit')
+            profit_chart = workbook.add_chart({'type': 'column'})
+            profit_chart.add_series({
+                'name': ['Deal Analysis', 0, profit_col],
+                'categories': ['Deal Analysis', 1, address_col, chart_rows, address_col],
+                'values': ['Deal Analysis', 1, profit_col, chart_rows, profit_col]
+            })
+            profit_chart.set_title({'name': 'Top Properties by Potential Profit'})
+            profit_chart.set_y_axis({'name': 'Profit ($)'})
+            profit_chart.set_x_axis({'name': 'Property'})
             
             # Add chart to sheet
-            chart_sheet.add_chart(profit_chart, "A1")
+            chart_sheet.insert_chart('A1', profit_chart)
             
             # Add a second chart for ROI
-            roi_chart = BarChart()
-            roi_chart.title = "Top Properties by ROI"
-            roi_chart.y_axis.title = "ROI (%)"
-            roi_chart.x_axis.title = "Property"
-            
-            # Get top 10 properties by ROI
-            top_roi = df.sort_values('ROI (%)', ascending=False).head(10)
-            
-            # Create references to data
-            roi_data = Reference(worksheet, min_col=10, min_row=1, max_row=min(11, len(df)+1))
-            
-            roi_chart.add_data(roi_data, titles_from_data=True)
-            roi_chart.set_categories(address_data)
+            roi_chart = workbook.add_chart({'type': 'column'})
+            roi_chart.add_series({
+                'name': ['Deal Analysis', 0, roi_col],
+                'categories': ['Deal Analysis', 1, address_col, chart_rows, address_col],
+                'values': ['Deal Analysis', 1, roi_col, chart_rows, roi_col]
+            })
+            roi_chart.set_title({'name': 'Top Properties by ROI'})
+            roi_chart.set_y_axis({'name': 'ROI (%)'})
+            roi_chart.set_x_axis({'name': 'Property'})
             
             # Add chart to sheet
-            chart_sheet.add_chart(roi_chart, "A20")
-            
-            # Add a summary sheet
-            summary_sheet = workbook.create_sheet(title='Summary')
-            
-            # Summary statistics
-            summary_data = {
-                'Metric': [
-                    'Total Properties Analyzed',
-                    'Properties Meeting Criteria',
-                    'Average List Price',
-                    'Average ARV',
-                    'Average Repair Costs',
-                    'Average Profit',
-                    'Average ROI',
-                    'Highest Potential Profit',
-                    'Highest ROI',
-                    'Properties Meeting 70% Rule'
-                ],
-                'Value': [
-                    len(df),
-                    sum(1 for deal in deals if deal.get('meets_criteria', False)),
-                    df['List Price'].mean(),
-                    df['ARV'].mean(),
-                    df['Repair Costs'].mean(),
-                    df['Profit'].mean(),
-                    df['ROI (%)'].mean(),
-                    df['Profit'].max(),
-                    df['ROI (%)'].max(),
-                    sum(1 for deal in deals if deal.get('meets_70_percent_rule', False))
-                ]
-            }
-            
-            summary_df = pd.DataFrame(summary_data)
-            summary_df.to_excel(summary_sheet, index=False)
-            
-            # Format summary sheet
-            for cell in summary_sheet[1]:
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = centered_alignment
-                cell.border = border
-            
-            # Format the values
-            for row in summary_sheet.iter_rows(min_row=2, max_row=len(summary_data['Metric'])+1, min_col=1, max_col=2):
-                for cell in row:
-                    cell.border = border
-                    
-                    # Format numeric values
-                    if cell.column == 2 and cell.row >= 3 and cell.row <= 9:  # Value column for monetary amounts
-                        cell.number_format = '$#,##0.00'
-                    elif cell.column == 2 and (cell.row == 10 or cell.row == 11):  # Percentage values
-                        cell.number_format = '0.00%'
+            chart_sheet.insert_chart('A20', roi_chart)
+            
+            # Summary statistics, reduced in one pass
+            stats = df.agg({
+                'List Price': ['mean'],
+                'ARV': ['mean'],
+                'Repair Costs': ['mean'],
+                'Profit': ['mean', 'max'],
+                'ROI (%)': ['mean', 'max'],
+                'Meets Criteria': ['sum'],
+                'Meets 70% Rule': ['sum']
+            })
+            
+            # Add a summary sheet: (metric, value, format)
+            summary_rows = [
+                ('Total Properties Analyzed', len(df), formats['data']),
+                ('Properties Meeting Criteria', int(stats.at['sum', 'Meets Criteria']), formats['data']),
+                ('Average List Price', float(stats.at['mean', 'List Price']), formats['money']),
+                ('Average ARV', float(stats.at['mean', 'ARV']), formats['money']),
+                ('Average Repair Costs', float(stats.at['mean', 'Repair Costs']), formats['money']),
+                ('Average Profit', float(stats.at['mean', 'Profit']), formats['money']),
+                ('Average ROI', float(stats.at['mean', 'ROI (%)']), formats['percent']),
+                ('Highest Potential Profit', float(stats.at['max', 'Profit']), formats['money']),
+                ('Highest ROI', float(stats.at['max', 'ROI (%)']), formats['percent']),
+                ('Properties Meeting 70% Rule', int(stats.at['sum', 'Meets 70% Rule']), formats['data'])
+            ]
+            
+            summary_sheet = workbook.add_worksheet('Summary')
+            summary_sheet.write_row(0, 0, ['Metric', 'Value'], formats['header'])
+            for row, (metric, value, value_format) in enumerate(summary_rows, start=1):
+                summary_sheet.write(row, 0, metric, formats['data'])
+                summary_sheet.write(row, 1, value, value_format)
             
             # Adjust column widths in summary sheet
-            summary_sheet.column_dimensions['A'].width = 30
-            summary_sheet.column_dimensions['B'].width = 20
+            summary_sheet.set_column('A:A', 30)
+            summary_sheet.set_column('B:B', 20)
             
         # Log success
         logger.info(f"Exported {len(deals)} deals to Excel file: {output_file}")
@@ -4,17 +4,92 @@ Notification - Send email alerts for new potential deals
 
 import logging
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
+import atexit
+import threading
+import mimetypes
+from email import policy
+from email.message import EmailMessage
 from typing import List, Dict, Any, Optional
 import os
 from config import credentials
 
 logger = logging.getLogger(__name__)
 
+class EmailClient:
+    """
+    SMTP connection that is reused across sends
+    
+    STARTTLS and login happen once, on the first send; a connection dropped by
+    the server is reopened once and the send retried. Use as a context manager
+    (or call close()) to end the session.
+    """
+    
+    def __init__(self, server: Optional[str] = None, port: Optional[int] = None,
+                 sender: Optional[str] = None, password: Optional[str] = None):
+        self.server = server or credentials.SMTP_SERVER
+        self.port = port or credentials.SMTP_PORT
+        self.sender = sender or credentials.EMAIL_SENDER
+        self.password = password or credentials.EMAIL_PASSWORD
+        self._smtp = None
+        self._lock = threading.Lock()
+    
+    def __enter__(self) -> 'EmailClient':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate the SMTP session if it isn't already open"""
+        if self._smtp is None:
+            smtp = smtplib.SMTP(self.server, self.port)
+            try:
+                smtp.starttls()
+                smtp.login(self.sender, self.password)
+            except Exception:
+                smtp.close()
+                raise
+            self._smtp = smtp
+        return self._smtp
+    
+    def send_message(self, msg: EmailMessage) -> None:
+        """
+        Send a message over the shared connection
+        
+        Args:
+            msg: Message to send
+        """
+        with self._lock:
+            try:
+                self._connect().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # The server closed an idle session; reconnect and retry once
+                self._smtp = None
+                self._connect().send_message(msg)
+    
+    def close(self) -> None:
+        """Quit the SMTP session if one is open"""
+        with self._lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except (smtplib.SMTPException, OSError):
+                    self._smtp.close()
+                self._smtp = None
+
+_DEFAULT_CLIENT = None
+
+def _get_default_client() -> EmailClient:
+    """Shared client used by send_email when no client is passed"""
+    global _DEFAULT_CLIENT
+    if _DEFAULT_CLIENT is None:
+        _DEFAULT_CLIENT = EmailClient()
+        atexit.register(_DEFAULT_CLIENT.close)
+    return _DEFAULT_CLIENT
+
 def send_email(subject: str, deals: Optional[List[Dict[str, Any]]] = None, 
-               message: Optional[str] = None, attachment_path: Optional[str] = None) -> bool:
+               message: Optional[str] = None, attachment_path: Optional[str] = None,
+               client: Optional[EmailClient] = None) -> bool:
     """
     Send an email notification with deal information
     
@@ -23,55 +98,61 @@ def send_email(subject: str, deals: Optional[List[Dict[str, Any]]] = None,
         deals: List of deals to include (optional)
         message: Custom message text (optional)
         attachment_path: Path to file to attach (optional)
+        client: SMTP client to send with (optional, defaults to a shared client)
         
     Returns:
         Boolean indicating success
     """
     try:
         # Setup email parameters
-        sender = credentials.EMAIL_SENDER
+        client = client or _get_default_client()
+        sender = client.sender
         recipient = credentials.EMAIL_RECIPIENT
-        password = credentials.EMAIL_PASSWORD
         
         # Create the email
-        msg = MIMEMultipart()
+        msg = EmailMessage(policy=policy.SMTP)
         msg['From'] = sender
         msg['To'] = recipient
         msg['Subject'] = subject
         
         # Build the email body
-        body = ""
+        parts = []
         
         # Add custom message if provided
         if message:
-            body += message + "\n\n"
+            parts.append(f"{message}\n\n")
         
         # Add deals if provided
         if deals:
-            body += f"Found {len(deals)} potential flip properties:\n\n"
-            
-            for i, deal in enumerate(deals, 1):
-                body += f"{i}. {deal['address']}\n"
-                body += f"   List Price: ${deal['list_price']:,.2f}, ARV: ${deal['arv']:,.2f}\n"
-                body += f"   Repair: ${deal['repair_costs']:,.2f}, Profit: ${deal['potential_profit']:,.2f}\n"
-                body += f"   ROI: {deal['roi']:.2f}%, Score: {deal['score']:.2f}\n"
-                body += "\n"
+            parts.append(f"Found {len(deals)} potential flip properties:\n\n")
+            parts.extend(
+                f"{i}. {deal['address']}\n"
+                f"   List Price: ${deal['list_price']:,.2f}, ARV: ${deal['arv']:,.2f}\n"
+                f"   Repair: ${deal['repair_costs']:,.2f}, Profit: ${deal['potential_profit']:,.2f}\n"
+                f"   ROI: {deal['roi']:.2f}%, Score: {deal['score']:.2f}\n"
+                "\n"
+                for i, deal in enumerate(deals, 1)
+            )
+        
+        body = "".join(parts)
         
         # Add the body to the email
-        msg.attach(MIMEText(body, 'plain'))
+        msg.set_content(body)
         
-        # Add attachment if provided
+        # Add attachment if provided (read once and encoded once, when the message is sent)
         if attachment_path and os.path.exists(attachment_path):
+            content_type, _ = mimetypes.guess_type(attachment_path)
+            maintype, subtype = (content_type or 'application/octet-stream').split('/', 1)
             with open(attachment_path, 'rb') as file:
-                attachment = MIMEApplication(file.read(), Name=os.path.basename(attachment_path))
-                attachment['Content-Disposition'] = f'attachment; filename="{os.path.basename(attachment_path)}"'
-                msg.attach(attachment)
+                msg.add_attachment(
+                    file.read(),
+                    maintype=maintype,
+                    subtype=subtype,
+                    filename=os.path.basename(attachment_path)
+                )
         
-        # Connect to the SMTP server and send
-        with smtplib.SMTP(credentials.SMTP_SERVER, credentials.SMTP_PORT) as server:
-            server.starttls()
-            server.login(sender, password)
-            server.send_message(msg)
+        # Send over the client's open connection (connecting on first use)
+        client.send_message(msg)
         
         logger.info(f"Email notification sent to {recipient}")
         return True
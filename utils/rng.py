@@ -0,0 +1,43 @@
+"""
+RNG - Seeded random generators for simulated data
+
+Every generator is spawned from one SeedSequence rooted at
+settings.RANDOM_SEED, so a fixed seed reproduces the simulated data and
+each thread or task still gets its own independent stream.
+"""
+
+import threading
+from typing import List
+from numpy.random import Generator, SeedSequence, default_rng
+from config import settings
+
+# Root of every simulated-data stream
+_SEED_SEQUENCE = SeedSequence(settings.RANDOM_SEED)
+_SPAWN_LOCK = threading.Lock()
+
+# Per-thread generators handed out by get_rng
+_local = threading.local()
+
+def spawn_rngs(n: int) -> List[Generator]:
+    """
+    Create independent generators, e.g. one per task submitted to a worker pool
+    
+    Spawning them up front in submission order keeps each task's draws the same
+    whichever thread ends up running it.
+    
+    Args:
+        n: Number of generators
+    
+    Returns:
+        List of n generators
+    """
+    with _SPAWN_LOCK:
+        children = _SEED_SEQUENCE.spawn(n)
+    return [default_rng(child) for child in children]
+
+def get_rng() -> Generator:
+    """Generator for the calling thread, spawned from the root seed on first use"""
+    rng = getattr(_local, 'rng', None)
+    if rng is None:
+        rng = _local.rng = spawn_rngs(1)[0]
+    return rng
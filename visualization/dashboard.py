@@ -3,178 +3,304 @@ Dashboard - Create interactive visualizations for property analysis
 """
 
 import logging
-import pandas as pd
-import json
-from typing import List, Dict, Any
+import gzip
+import re
+import textwrap
+from typing import List, Dict, Any, Iterable, Iterator, Tuple
 import os
+import orjson
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 logger = logging.getLogger(__name__)
 
-def generate_dashboard(deals: List[Dict[str, Any]], output_file: str) -> bool:
+# Size of the write buffer for dashboard files
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Output directories already created by this process
+_ensured_dirs = set()
+
+# Compression levels for .gz / .br dashboard files
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# Deal fields embedded in the dashboard for the cards, table and map popups,
+# with the format spec each is pre-formatted with in Python
+DASHBOARD_FIELDS = {
+    'address': '',
+    'list_price': ',.0f',
+    'arv': ',.0f',
+    'repair_costs': ',.0f',
+    'total_project_cost': ',.0f',
+    'potential_profit': ',.0f',
+    'roi': '.1f',
+    'score': '.1f'
+}
+
+# Number of (top-ranked) deals charted, and the fields charted for them
+CHART_DEALS = 10
+CHART_FIELDS = ('potential_profit', 'roi', 'repair_costs', 'score')
+
+# Deal table rows rendered up front, and per "Load more" click
+TABLE_PAGE_ROWS = 500
+
+# Most points embedded per chart; longer series are min-max decimated
+CHART_MAX_POINTS = 800
+
+def _dumps(payload: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON (NumPy values included, NaN as null)"""
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def _decimate_indices(series: List[List[float]], max_points: int) -> List[int]:
     """
-    Generate an HTML dashboard with property analysis visualizations
+    Pick the rows holding each series' min and max within evenly sized blocks
     
     Args:
-        deals: List of analyzed property deals
-        output_file: Path to save the HTML dashboard
+        series: Equal-length value lists sharing one x axis
+        max_points: Upper bound on the number of rows kept
         
     Returns:
-        Boolean indicating success
+        Sorted row indices (every row when there are no more than max_points)
     """
-    try:
-        if not deals:
-            logger.warning("No deals to visualize")
-            return False
+    n = len(series[0]) if series else 0
+    if n <= max_points:
+        return list(range(n))
+    
+    # Each block keeps up to two rows per series, so size the blocks to fit
+    n_blocks = max(1, max_points // (2 * len(series)))
+    keep = set()
+    for b in range(n_blocks):
+        block = range(b * n // n_blocks, (b + 1) * n // n_blocks)
+        for values in series:
+            keep.add(min(block, key=values.__getitem__))
+            keep.add(max(block, key=values.__getitem__))
+    return sorted(keep)
+
+def _chart_columns(deals: List[Dict[str, Any]]) -> Iterator[Tuple[str, List[Any]]]:
+    """Yield (name, values) for the chart series, cut to the top deals and decimated"""
+    top_deals = deals[:CHART_DEALS]
+    series = [[deal[field] for deal in top_deals] for field in CHART_FIELDS]
+    keep = _decimate_indices(series, CHART_MAX_POINTS)
+    yield 'labels', [top_deals[i]['address'].split(',')[0] for i in keep]
+    for field, values in zip(CHART_FIELDS, series):
+        yield field, [values[i] for i in keep]
+
+def _deal_columns(deals: List[Dict[str, Any]]) -> Iterator[Tuple[str, List[Any]]]:
+    """Yield (name, values) for each embedded deal field, formatted for display"""
+    for field, spec in DASHBOARD_FIELDS.items():
+        yield field, [format(deal[field], spec) for deal in deals]
+
+def _marker_columns(deals: List[Dict[str, Any]]) -> Iterator[Tuple[str, List[Any]]]:
+    """Yield (name, values) for the map markers: deals with non-zero coordinates only"""
+    located = []
+    for i, deal in enumerate(deals):
+        lat = deal['property_data'].get('latitude')
+        lng = deal['property_data'].get('longitude')
+        if lat and lng:
+            located.append((i, lat, lng))
+    
+    # 'deal' indexes back into the deal columns for the popup text
+    yield 'deal', [i for i, _, _ in located]
+    yield 'lat', [lat for _, lat, _ in located]
+    yield 'lng', [lng for _, _, lng in located]
+
+class _BrotliWriter:
+    """Binary file wrapper that brotli-compresses everything written to it"""
+    
+    def __init__(self, path: str):
+        self._file = open(path, 'wb', buffering=WRITE_BUFFER_SIZE)
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    
+    def write(self, data: bytes) -> None:
+        self._file.write(self._compressor.process(data))
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._file.write(self._compressor.finish())
+        finally:
+            self._file.close()
+
+def _open_output(path: str):
+    """Open a dashboard file for binary writing, compressed if it ends in .gz or .br"""
+    if path.endswith('.gz'):
+        return gzip.open(path, 'wb', compresslevel=GZIP_LEVEL)
+    if path.endswith('.br'):
+        if brotli is None:
+            raise ImportError("brotli is required to write .br dashboards")
+        return _BrotliWriter(path)
+    return open(path, 'wb', buffering=WRITE_BUFFER_SIZE)
+
+def _write_columns(f, columns: Iterable[Tuple[str, List[Any]]]) -> None:
+    """Write (name, values) pairs as a columnar JSON object, encoding one column at a time"""
+    separator = b'{'
+    for name, values in columns:
+        f.write(separator + _dumps(name) + b':')
+        f.write(_dumps(values))
+        separator = b','
+    f.write(b'}')
+
+# Dashboard page, with DEALS_JSON_PLACEHOLDER standing in for the deals data.
+# Dedented and stripped of indentation and blank lines once, at import
+DASHBOARD_TEMPLATE = re.sub(r'\n\s+', '\n', textwrap.dedent("""\
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>Real Estate Flip Finder Dashboard</title>
+        <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+        <script src="https://cdn.jsdelivr.net/npm/leaflet@1.7.1/dist/leaflet.js"></script>
+        <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/leaflet@1.7.1/dist/leaflet.css">
+        <style>
+            body { font-family: Arial, sans-serif; margin: 0; padding: 20px; }
+            h1, h2 { color: #333; }
+            .dashboard-container { display: flex; flex-wrap: wrap; }
+            .chart-container { width: 48%; margin: 1%; height: 300px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }
+            .full-width { width: 98%; }
+            .property-list { margin-top: 20px; }
+            .property-card { border: 1px solid #ddd; padding: 15px; margin-bottom: 10px; border-radius: 5px; }
+            .property-header { display: flex; justify-content: space-between; }
+            .property-title { font-weight: bold; }
+            .property-score { font-weight: bold; color: #4CAF50; }
+            .property-details { display: flex; flex-wrap: wrap; margin-top: 10px; }
+            .property-detail { width: 25%; margin-bottom: 5px; }
+            .map-container { height: 400px; width: 98%; margin: 1%; }
+            table { width: 100%; border-collapse: collapse; margin-top: 20px; }
+            th, td { text-align: left; padding: 8px; border-bottom: 1px solid #ddd; }
+            th { background-color: #f2f2f2; }
+            tr:hover { background-color: #f5f5f5; }
+            .load-more { margin-top: 10px; padding: 8px 16px; cursor: pointer; }
+        </style>
+    </head>
+    <body>
+        <h1>Real Estate Flip Finder Dashboard</h1>
         
-        # Create a basic HTML template with placeholders for our data
-        html_template = """
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Real Estate Flip Finder Dashboard</title>
-            <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-            <script src="https://cdn.jsdelivr.net/npm/leaflet@1.7.1/dist/leaflet.js"></script>
-            <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/leaflet@1.7.1/dist/leaflet.css">
-            <style>
-                body { font-family: Arial, sans-serif; margin: 0; padding: 20px; }
-                h1, h2 { color: #333; }
-                .dashboard-container { display: flex; flex-wrap: wrap; }
-                .chart-container { width: 48%; margin: 1%; height: 300px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }
-                .full-width { width: 98%; }
-                .property-list { margin-top: 20px; }
-                .property-card { border: 1px solid #ddd; padding: 15px; margin-bottom: 10px; border-radius: 5px; }
-                .property-header { display: flex; justify-content: space-between; }
-                .property-title { font-weight: bold; }
-                .property-score { font-weight: bold; color: #4CAF50; }
-                .property-details { display: flex; flex-wrap: wrap; margin-top: 10px; }
-                .property-detail { width: 25%; margin-bottom: 5px; }
-                .map-container { height: 400px; width: 98%; margin: 1%; }
-                table { width: 100%; border-collapse: collapse; margin-top: 20px; }
-                th, td { text-align: left; padding: 8px; border-bottom: 1px solid #ddd; }
-                th { background-color: #f2f2f2; }
-                tr:hover { background-color: #f5f5f5; }
-            </style>
-        </head>
-        <body>
-            <h1>Real Estate Flip Finder Dashboard</h1>
-            
-            <div class="dashboard-container">
-                <div class="chart-container">
-                    <canvas id="profitChart"></canvas>
-                </div>
-                <div class="chart-container">
-                    <canvas id="roiChart"></canvas>
-                </div>
-                <div class="chart-container">
-                    <canvas id="repairCostChart"></canvas>
-                </div>
-                <div class="chart-container">
-                    <canvas id="scoreChart"></canvas>
-                </div>
-                <div id="mapContainer" class="map-container"></div>
+        <div class="dashboard-container">
+            <div class="chart-container">
+                <canvas id="profitChart"></canvas>
             </div>
-            
-            <h2>Top Properties</h2>
-            <div class="property-list" id="propertyList">
-                <!-- Property cards will be inserted here -->
+            <div class="chart-container">
+                <canvas id="roiChart"></canvas>
+            </div>
+            <div class="chart-container">
+                <canvas id="repairCostChart"></canvas>
+            </div>
+            <div class="chart-container">
+                <canvas id="scoreChart"></canvas>
             </div>
+            <div id="mapContainer" class="map-container"></div>
+        </div>
+        
+        <h2>Top Properties</h2>
+        <div class="property-list" id="propertyList">
+            <!-- Property cards will be inserted here -->
+        </div>
+        
+        <h2>Deal Comparison</h2>
+        <table id="dealTable">
+            <tr>
+                <th>Address</th>
+                <th>List Price</th>
+                <th>ARV</th>
+                <th>Repair Cost</th>
+                <th>Total Cost</th>
+                <th>Profit</th>
+                <th>ROI</th>
+                <th>Score</th>
+            </tr>
+            <!-- Table rows will be inserted here -->
+        </table>
+        <button id="loadMoreRows" class="load-more" style="display: none"></button>
+        
+        <script>
+            // Data from Python: chart series for the top deals, and one array per deal field
+            const payload = DEALS_JSON_PLACEHOLDER;
+            const chartData = payload.chart;
+            const D = payload.deals;
+            const dealCount = D.address.length;
+            const dealFields = Object.keys(D);
             
-            <h2>Deal Comparison</h2>
-            <table id="dealTable">
-                <tr>
-                    <th>Address</th>
-                    <th>List Price</th>
-                    <th>ARV</th>
-                    <th>Repair Cost</th>
-                    <th>Total Cost</th>
-                    <th>Profit</th>
-                    <th>ROI</th>
-                    <th>Score</th>
-                </tr>
-                <!-- Table rows will be inserted here -->
-            </table>
+            // Rebuild a deal object from the columns on demand
+            function row(i) {
+                const deal = {};
+                for (const key of dealFields) {
+                    deal[key] = D[key][i];
+                }
+                return deal;
+            }
             
-            <script>
-                // Data from Python
-                const dealsData = DEALS_JSON_PLACEHOLDER;
-                
-                // Create property cards
-                const propertyListEl = document.getElementById('propertyList');
-                dealsData.slice(0, 5).forEach(deal => {
-                    const card = document.createElement('div');
-                    card.className = 'property-card';
-                    card.innerHTML = `
+            // Create property cards (one HTML string, parsed and attached once)
+            const cardCount = Math.min(5, dealCount);
+            const cards = new Array(cardCount);
+            for (let i = 0; i < cardCount; i++) {
+                const deal = row(i);
+                cards[i] = `
+                    <div class="property-card">
                         <div class="property-header">
                             <div class="property-title">${deal.address}</div>
-                            <div class="property-score">Score: ${deal.score.toFixed(1)}</div>
+                            <div class="property-score">Score: ${deal.score}</div>
                         </div>
                         <div class="property-details">
-                            <div class="property-detail">List: $${deal.list_price.toLocaleString()}</div>
-                            <div class="property-detail">ARV: $${deal.arv.toLocaleString()}</div>
-                            <div class="property-detail">Repair: $${deal.repair_costs.toLocaleString()}</div>
-                            <div class="property-detail">Profit: $${deal.potential_profit.toLocaleString()}</div>
-                            <div class="property-detail">ROI: ${deal.roi.toFixed(1)}%</div>
+                            <div class="property-detail">List: $${deal.list_price}</div>
+                            <div class="property-detail">ARV: $${deal.arv}</div>
+                            <div class="property-detail">Repair: $${deal.repair_costs}</div>
+                            <div class="property-detail">Profit: $${deal.potential_profit}</div>
+                            <div class="property-detail">ROI: ${deal.roi}%</div>
                         </div>
+                    </div>
+                `;
+            }
+            document.getElementById('propertyList').insertAdjacentHTML('beforeend', cards.join(''));
+            
+            // Create table rows a page at a time (each page one HTML string,
+            // parsed and attached once); the rest are built on "Load more"
+            const dealTable = document.getElementById('dealTable');
+            const loadMore = document.getElementById('loadMoreRows');
+            let shown = 0;
+            function showTableRows() {
+                const end = Math.min(shown + payload.table_page, dealCount);
+                const rows = new Array(end - shown);
+                for (let i = shown; i < end; i++) {
+                    const deal = row(i);
+                    rows[i - shown] = `
+                        <tr>
+                            <td>${deal.address}</td>
+                            <td>$${deal.list_price}</td>
+                            <td>$${deal.arv}</td>
+                            <td>${deal.repair_costs}</td>
+                            <td>${deal.total_project_cost}</td>
+                            <td>${deal.potential_profit}</td>
+                            <td>${deal.roi}%</td>
+                            <td>${deal.score}</td>
+                        </tr>
                     `;
-                    propertyListEl.appendChild(card);
-                });
-                
-                // Create table rows
-                const tableEl = document.getElementById('dealTable');
-                dealsData.forEach(deal => {
-                    const row = document.createElement('tr');
-                    row.innerHTML = `
-                        <td>${deal.address}</td>
-                        <td>$${deal.list_price.toLocaleString()}</td>
-                        <td>$${deal.arv.toLocaleString()}</td>
-                        <td>${deal.repair_costs.toLocaleString()}</td>
-                        <td>${deal.total_project_cost.toLocaleString()}</td>
-                        <td>${deal.potential_profit.toLocaleString()}</td>
-                        <td>${deal.roi.toFixed(1)}%</td>
-                        <td>${deal.score.toFixed(1)}</td>
-                    `;
-                    tableEl.appendChild(row);
-                });
-                
-                // Profit Chart
-                const profitCtx = document.getElementById('profitChart').getContext('2d');
-                new Chart(profitCtx, {
-                    type: 'bar',
-                    data: {
-                        labels: dealsData.slice(0, 10).map(deal => deal.address.split(',')[0]),
-                        datasets: [{
-                            label: 'Potential Profit',
-                            data: dealsData.slice(0, 10).map(deal => deal.potential_profit),
-                            backgroundColor: 'rgba(54, 162, 235, 0.5)',
-                            borderColor: 'rgba(54, 162, 235, 1)',
-                            borderWidth: 1
-                        }]
-                    },
-                    options: {
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {
-                            title: {
-                                display: true,
-                                text: 'Potential Profit by Property'
-                            }
-                        }
-                    }
-                });
-                
-                // ROI Chart
-                const roiCtx = document.getElementById('roiChart').getContext('2d');
-                new Chart(roiCtx, {
+                }
+                dealTable.insertAdjacentHTML('beforeend', rows.join(''));
+                shown = end;
+                loadMore.textContent = `Load more (${dealCount - shown} remaining)`;
+                loadMore.style.display = shown < dealCount ? '' : 'none';
+            }
+            loadMore.addEventListener('click', showTableRows);
+            showTableRows();
+            
+            // Bar chart of one series over the charted deals
+            function barChart(id, label, title, rgb, data) {
+                return new Chart(document.getElementById(id).getContext('2d'), {
                     type: 'bar',
                     data: {
-                        labels: dealsData.slice(0, 10).map(deal => deal.address.split(',')[0]),
+                        labels: chartData.labels,
                         datasets: [{
-                            label: 'ROI (%)',
-                            data: dealsData.slice(0, 10).map(deal => deal.roi),
-                            backgroundColor: 'rgba(75, 192, 192, 0.5)',
-                            borderColor: 'rgba(75, 192, 192, 1)',
+                            label: label,
+                            data: data,
+                            backgroundColor: `rgba(${rgb}, 0.5)`,
+                            borderColor: `rgba(${rgb}, 1)`,
                             borderWidth: 1
                         }]
                     },
@@ -184,123 +310,91 @@ def generate_dashboard(deals: List[Dict[str, Any]], output_file: str) -> bool:
                         plugins: {
                             title: {
                                 display: true,
-                                text: 'ROI by Property'
+                                text: title
                             }
                         }
                     }
                 });
+            }
+            
+            barChart('profitChart', 'Potential Profit', 'Potential Profit by Property', '54, 162, 235', chartData.potential_profit);
+            barChart('roiChart', 'ROI (%)', 'ROI by Property', '75, 192, 192', chartData.roi);
+            barChart('repairCostChart', 'Repair Costs', 'Repair Costs by Property', '255, 99, 132', chartData.repair_costs);
+            barChart('scoreChart', 'Property Score', 'Property Score', '153, 102, 255', chartData.score);
+            
+            // Initialize map if we have properties with coordinates
+            // Markers are pre-filtered to deals with coordinates
+            const markers = payload.markers;
+            
+            if (markers.deal.length) {
                 
-                // Repair Cost Chart
-                const repairCtx = document.getElementById('repairCostChart').getContext('2d');
-                new Chart(repairCtx, {
-                    type: 'bar',
-                    data: {
-                        labels: dealsData.slice(0, 10).map(deal => deal.address.split(',')[0]),
-                        datasets: [{
-                            label: 'Repair Costs',
-                            data: dealsData.slice(0, 10).map(deal => deal.repair_costs),
-                            backgroundColor: 'rgba(255, 99, 132, 0.5)',
-                            borderColor: 'rgba(255, 99, 132, 1)',
-                            borderWidth: 1
-                        }]
-                    },
-                    options: {
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {
-                            title: {
-                                display: true,
-                                text: 'Repair Costs by Property'
-                            }
-                        }
-                    }
-                });
+                const map = L.map('mapContainer').setView([markers.lat[0], markers.lng[0]], 12);
                 
-                // Score Chart
-                const scoreCtx = document.getElementById('scoreChart').getContext('2d');
-                new Chart(scoreCtx, {
-                    type: 'bar',
-                    data: {
-                        labels: dealsData.slice(0, 10).map(deal => deal.address.split(',')[0]),
-                        datasets: [{
-                            label: 'Property Score',
-                            data: dealsData.slice(0, 10).map(deal => deal.score),
-                            backgroundColor: 'rgba(153, 102, 255, 0.5)',
-                            borderColor: 'rgba(153, 102, 255, 1)',
-                            borderWidth: 1
-                        }]
-                    },
-                    options: {
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {
-                            title: {
-                                display: true,
-                                text: 'Property Score'
-                            }
-                        }
-                    }
-                });
+                L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', {
+                    attribution: '&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> contributors'
+                }).addTo(map);
                 
-                // Initialize map if we have properties with coordinates
-                if (dealsData.some(deal => 
-                    deal.property_data.latitude && 
-                    deal.property_data.longitude &&
-                    deal.property_data.latitude !== 0 &&
-                    deal.property_data.longitude !== 0)) {
-                    
-                    const map = L.map('mapContainer').setView([dealsData[0].property_data.latitude, dealsData[0].property_data.longitude], 12);
-                    
-                    L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', {
-                        attribution: '&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> contributors'
-                    }).addTo(map);
-                    
-                    dealsData.forEach(deal => {
-                        if (deal.property_data.latitude && 
-                            deal.property_data.longitude &&
-                            deal.property_data.latitude !== 0 &&
-                            deal.property_data.longitude !== 0) {
-                                
-                            L.marker([deal.property_data.latitude, deal.property_data.longitude])
-                                .addTo(map)
-                                .bindPopup(
-                                    '<b>' + deal.address + '</b><br>' +
-                                    'List:  + deal.list_price.toLocaleString() + '<br>' +
-                                    'Profit:  + deal.potential_profit.toLocaleString() + '<br>' +
-                                    'ROI: ' + deal.roi.toFixed(1) + '%'
-                                );
-                        }
-                    });
-                } else {
-                    document.getElementById('mapContainer').innerHTML = '<p>No valid property coordinates available for mapping</p>';
+                for (let m = 0; m < markers.deal.length; m++) {
+                    const i = markers.deal[m];
+                    L.marker([markers.lat[m], markers.lng[m]])
+                        .addTo(map)
+                        .bindPopup(
+                            '<b>' + D.address[i] + '</b><br>' +
+                            'List: $' + D.list_price[i] + '<br>' +
+                            'Profit: $' + D.potential_profit[i] + '<br>' +
+                            'ROI: ' + D.roi[i] + '%'
+                        );
                 }
-            </script>
-        </body>
-        </html>
-        """
-        
-        # Convert deals to JSON for embedding in HTML
-        deals_json = json.dumps([{
-            'address': deal['address'],
-            'list_price': deal['list_price'],
-            'arv': deal['arv'],
-            'repair_costs': deal['repair_costs'],
-            'total_project_cost': deal['total_project_cost'],
-            'potential_profit': deal['potential_profit'],
-            'roi': deal['roi'],
-            'score': deal['score'],
-            'property_data': deal['property_data']
-        } for deal in deals])
+            } else {
+                document.getElementById('mapContainer').innerHTML = '<p>No valid property coordinates available for mapping</p>';
+            }
+        </script>
+    </body>
+    </html>
+    """))
+
+# The template split around the data placeholder and encoded once at import,
+# so the deals JSON can be streamed between the two halves
+_PREFIX, _SUFFIX = (part.encode('utf-8') for part in DASHBOARD_TEMPLATE.split('DEALS_JSON_PLACEHOLDER'))
+
+def generate_dashboard(deals: List[Dict[str, Any]], output_file: str,
+                       max_table_rows: int = TABLE_PAGE_ROWS) -> bool:
+    """
+    Generate an HTML dashboard with property analysis visualizations
+    
+    Args:
+        deals: List of analyzed property deals
+        output_file: Path to save the HTML dashboard. A .gz or .br suffix writes it
+            gzip/brotli-compressed; serve it with the matching Content-Encoding
+        max_table_rows: Deal table rows rendered on load (and per "Load more" click)
         
-        # Replace placeholder with actual JSON data
-        html_content = html_template.replace('DEALS_JSON_PLACEHOLDER', deals_json)
+    Returns:
+        Boolean indicating success
+    """
+    try:
+        if not deals:
+            logger.warning("No deals to visualize")
+            return False
         
-        # Ensure output directory exists
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        # Ensure output directory exists (once per directory; none for a bare filename)
+        output_dir = os.path.dirname(output_file)
+        if output_dir and output_dir not in _ensured_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+            _ensured_dirs.add(output_dir)
         
-        # Write HTML to file
-        with open(output_file, 'w') as f:
-            f.write(html_content)
+        # Write HTML to file, streaming the deals as columnar JSON (one array
+        # per field) so no single buffer holds the whole payload
+        with _open_output(output_file) as f:
+            f.write(_PREFIX)
+            f.write(b'{"chart":')
+            _write_columns(f, _chart_columns(deals))
+            f.write(b',"deals":')
+            _write_columns(f, _deal_columns(deals))
+            f.write(b',"markers":')
+            _write_columns(f, _marker_columns(deals))
+            f.write(b',"table_page":' + _dumps(max(1, max_table_rows)))
+            f.write(b'}')
+            f.write(_SUFFIX)
         
         logger.info(f"Dashboard generated and saved to {output_file}")
         return True